@@ -6,7 +6,9 @@ from .plugin import (
     _patch_sqlalchemy_plugin,
     _patch_worker,
     fx_app,
+    fx_app_or_callable,
     fx_cap_logger,
+    fx_cap_logger_bound,
     fx_client,
     fx_is_unit_test,
     pytest_addoption,
@@ -8,24 +8,25 @@ from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
-from starlite import Starlite, TestClient
-from structlog.contextvars import clear_contextvars
-from structlog.testing import CapturingLogger
-from uvicorn.importer import ImportFromStringError, import_from_string
 
 from starlite_saqlalchemy import constants
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+    from typing import Any
 
     from pytest import Config, FixtureRequest, MonkeyPatch, Parser
+    from starlite import Starlite, TestClient
+    from structlog.testing import CapturingLogger
 
 __all__ = (
     "_patch_http_close",
     "_patch_sqlalchemy_plugin",
     "_patch_worker",
     "fx_app",
+    "fx_app_or_callable",
     "fx_cap_logger",
+    "fx_cap_logger_bound",
     "fx_client",
     "fx_is_unit_test",
     "pytest_addoption",
@@ -90,24 +91,41 @@ def _patch_worker(is_unit_test: bool, monkeypatch: MonkeyPatch) -> None:
         monkeypatch.setattr(worker.Worker, "stop", MagicMock())
 
 
-@pytest.fixture(name="app")
-def fx_app(pytestconfig: Config, monkeypatch: MonkeyPatch) -> Starlite:
-    """
+@pytest.fixture(name="_app_or_callable", scope="session")
+def fx_app_or_callable(pytestconfig: Config) -> Starlite | Callable[[], Starlite] | None:
+    """Resolve the `test_app` ini option once per session.
+
     Returns:
-        An application instance, configured via plugin.
+        The application instance or callable that returns one, or `None` if the option cannot
+        be imported.
     """
+    from uvicorn.importer import ImportFromStringError, import_from_string
+
     test_app_str = pytestconfig.getini("test_app")
     try:
-        app_or_callable = import_from_string(test_app_str)
+        return import_from_string(test_app_str)  # type:ignore[no-any-return]
     except (ImportFromStringError, ModuleNotFoundError):
+        return None
+
+
+@pytest.fixture(name="app")
+def fx_app(
+    _app_or_callable: Starlite | Callable[[], Starlite] | None, monkeypatch: MonkeyPatch
+) -> Starlite:
+    """
+    Returns:
+        An application instance, configured via plugin.
+    """
+    from starlite import Starlite
+
+    if _app_or_callable is None:
         from starlite_saqlalchemy.init_plugin import ConfigureApp
 
         app = Starlite(route_handlers=[], on_app_init=[ConfigureApp()], openapi_config=None)
+    elif isinstance(_app_or_callable, Starlite):
+        app = _app_or_callable
     else:
-        if isinstance(app_or_callable, Starlite):
-            app = app_or_callable
-        else:
-            app = app_or_callable()
+        app = _app_or_callable()
 
     monkeypatch.setattr(app, "before_startup", [])
     return app
@@ -116,26 +134,47 @@ def fx_app(pytestconfig: Config, monkeypatch: MonkeyPatch) -> Starlite:
 @pytest.fixture(name="client")
 def fx_client(app: Starlite) -> Generator[TestClient, None, None]:
     """Test client fixture for making calls on the global app instance."""
+    from starlite import TestClient
+
     with TestClient(app=app) as client:
         yield client
 
 
-@pytest.fixture(name="cap_logger")
-def fx_cap_logger(monkeypatch: MonkeyPatch) -> CapturingLogger:
-    """Used to monkeypatch the app logger, so we can inspect output."""
+@pytest.fixture(name="_cap_logger_bound", scope="session")
+def fx_cap_logger_bound() -> Any:
+    """Configure logging, and bind the logger that `cap_logger` patches in, once per session.
+
+    Returns:
+        A bound logger that logs to a `CapturingLogger`.
+    """
+    from structlog.testing import CapturingLogger
+
     import starlite_saqlalchemy
 
     starlite_saqlalchemy.log.configure(
         starlite_saqlalchemy.log.default_processors  # type:ignore[arg-type]
     )
-    # clear context for every test
-    clear_contextvars()
     # pylint: disable=protected-access
     logger = starlite_saqlalchemy.log.controller.LOGGER.bind()
     logger._logger = CapturingLogger()
     # drop rendering processor to get a dict, not bytes
     # noinspection PyProtectedMember
-    logger._processors = starlite_saqlalchemy.log.default_processors[:-1]
-    monkeypatch.setattr(starlite_saqlalchemy.log.controller, "LOGGER", logger)
-    monkeypatch.setattr(starlite_saqlalchemy.log.worker, "LOGGER", logger)
-    return logger._logger
+    logger._processors = tuple(starlite_saqlalchemy.log.default_processors[:-1])
+    return logger
+
+
+@pytest.fixture(name="cap_logger")
+def fx_cap_logger(_cap_logger_bound: Any, monkeypatch: MonkeyPatch) -> CapturingLogger:
+    """Used to monkeypatch the app logger, so we can inspect output."""
+    from structlog.contextvars import clear_contextvars
+
+    import starlite_saqlalchemy
+
+    # clear context and captured calls for every test
+    clear_contextvars()
+    # pylint: disable=protected-access
+    cap_logger: CapturingLogger = _cap_logger_bound._logger
+    cap_logger.calls.clear()
+    monkeypatch.setattr(starlite_saqlalchemy.log.controller, "LOGGER", _cap_logger_bound)
+    monkeypatch.setattr(starlite_saqlalchemy.log.worker, "LOGGER", _cap_logger_bound)
+    return cap_logger
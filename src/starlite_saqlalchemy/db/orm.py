@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from typing import Any, TypeVar
 from uuid import UUID, uuid4
 
@@ -16,6 +17,7 @@ from sqlalchemy.orm import (
     declared_attr,
     mapped_column,
     registry,
+    relationship,
 )
 
 from starlite_saqlalchemy import dto, settings
@@ -47,9 +49,10 @@ def touch_updated_timestamp(session: Session, *_: Any) -> None:
         session: The sync [`Session`][sqlalchemy.orm.Session] instance that underlies the async
             session.
     """
+    now = datetime.now()
     for instance in session.dirty:
         if hasattr(instance, "updated"):
-            instance.updated = datetime.now()
+            instance.updated = now
 
 
 @declarative_mixin
@@ -58,6 +61,12 @@ class CommonColumns:
 
     __abstract__ = True
     __name__: str
+    __mapper_args__ = {"eager_defaults": True}
+    """Fetch server-generated values with `RETURNING` as part of the flush.
+
+    Saves a round-trip to load them afterwards. Models that declare their own `__mapper_args__`
+    should include this setting.
+    """
 
     id: Mapped[UUID] = mapped_column(
         default=uuid4, primary_key=True, info={DTO_KEY: dto.DTOField(mark=dto.Mark.READ_ONLY)}
@@ -90,6 +99,13 @@ class AuditColumns:
 meta = MetaData(naming_convention=convention)
 registry_ = registry(metadata=meta, type_annotation_map={UUID: pg.UUID, dict: pg.JSONB})
 
+relationship_selectin = partial(relationship, lazy="selectin")
+"""[`relationship()`][sqlalchemy.orm.relationship] that eagerly loads related objects.
+
+Related objects are loaded with a second `SELECT ... WHERE ... IN (...)` statement, which avoids
+the row multiplication of a joined eager load for collections.
+"""
+
 
 class Base(CommonColumns, DeclarativeBase):
     """Base for all SQLAlchemy declarative models."""
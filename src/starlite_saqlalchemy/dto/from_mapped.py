@@ -8,6 +8,7 @@ should always be private, or read-only at the model declaration layer.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from inspect import getmodule
 from types import UnionType
 from typing import (
@@ -49,6 +50,12 @@ __all__ = ("FromMapped",)
 
 AnyDeclarative = TypeVar("AnyDeclarative", bound=DeclarativeBase)
 
+_DTO_CACHE: dict[
+    tuple[type[FromMapped[Any]], str, type[DeclarativeBase], Purpose, frozenset[str]],
+    type[FromMapped[Any]],
+] = {}
+"""DTO types built by `FromMapped._factory()`, by base type, name, model and config."""
+
 
 class FromMapped(BaseModel, Generic[AnyDeclarative]):
     """Produce an SQLAlchemy instance with values from a pydantic model."""
@@ -119,14 +126,21 @@ class FromMapped(BaseModel, Generic[AnyDeclarative]):
 
     @classmethod
     def _factory(
-        cls, name: str, model: type[DeclarativeBase], purpose: Purpose, exclude: set[str]
+        cls, name: str, model: type[DeclarativeBase], purpose: Purpose, exclude: frozenset[str]
     ) -> type[FromMapped[AnyDeclarative]]:
-        exclude = set() if exclude is None else exclude
+        key = (cls, name, model, purpose, exclude)
+        if key not in _DTO_CACHE:
+            _DTO_CACHE[key] = cls._build(name, model, purpose, exclude)
+        return _DTO_CACHE[key]
 
+    @classmethod
+    def _build(
+        cls, name: str, model: type[DeclarativeBase], purpose: Purpose, exclude: frozenset[str]
+    ) -> type[FromMapped[AnyDeclarative]]:
         columns, relationships = _inspect_model(model)
         fields: dict[str, tuple[Any, FieldInfo]] = {}
         validators: dict[str, AnyClassMethod] = {}
-        for key, type_hint in get_type_hints(model, localns=_get_localns(model)).items():
+        for key, type_hint in _get_type_hints(model).items():
             if get_origin(type_hint) is Mapped:
                 (type_hint,) = get_args(type_hint)
 
@@ -181,7 +195,7 @@ class FromMapped(BaseModel, Generic[AnyDeclarative]):
             return origin_type[inner_types]  # pyright:ignore
 
         type_hint = cls._factory(
-            f"{name}_{type_hint.__name__}", type_hint, purpose=purpose, exclude=set()
+            f"{name}_{type_hint.__name__}", type_hint, purpose=purpose, exclude=frozenset()
         )
         return type_hint
 
@@ -210,7 +224,10 @@ def _get_dto_field(elem: Column | RelationshipProperty) -> DTOField:
 
 
 def _should_exclude_field(
-    purpose: Purpose, elem: Column | RelationshipProperty, exclude: set[str], dto_attrib: DTOField
+    purpose: Purpose,
+    elem: Column | RelationshipProperty,
+    exclude: frozenset[str],
+    dto_attrib: DTOField,
 ) -> bool:
     if elem.key in exclude:
         return True
@@ -230,6 +247,12 @@ def _inspect_model(
     return columns, relationships
 
 
+@lru_cache(maxsize=None)
+def _get_type_hints(model: type[DeclarativeBase]) -> dict[str, Any]:
+    """Resolve the type hints of `model` once per model type."""
+    return get_type_hints(model, localns=_get_localns(model))
+
+
 def _get_localns(model: type[DeclarativeBase]) -> dict[str, Any]:
     model_module = getmodule(model)
     return vars(model_module) if model_module is not None else {}
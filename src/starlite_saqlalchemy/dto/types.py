@@ -1,7 +1,7 @@
 """DTO domain types."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, TypeVar
 
@@ -76,11 +76,15 @@ class DTOField:
     the field."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class DTOConfig:
     """Control the generated DTO."""
 
     purpose: Purpose
     """Configure the DTO for "read" or "write" operations."""
-    exclude: set[str] = field(default_factory=set)
+    exclude: frozenset[str] = frozenset()
     """Explicitly exclude fields from the generated DTO."""
+
+    def __post_init__(self) -> None:
+        # keeps instances hashable when `exclude` is given as a `set`
+        object.__setattr__(self, "exclude", frozenset(self.exclude))
@@ -1,6 +1,7 @@
 """Things that make working with DTOs nicer."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from starlite_saqlalchemy import settings
@@ -20,7 +21,7 @@ __all__ = (
 
 
 def config(
-    purpose: Purpose | Literal["read", "write"], exclude: set[str] | None = None
+    purpose: Purpose | Literal["read", "write"], exclude: Iterable[str] | None = None
 ) -> DTOConfig:
     """
     Args:
@@ -28,10 +29,14 @@ def config(
         exclude: Omit fields from dto by key name.
 
     Returns:
-        `DTOConfig` object configured per parameters.
+        `DTOConfig` object configured per parameters. Equal arguments return the same instance.
     """
-    exclude = set() if exclude is None else exclude
-    return DTOConfig(purpose=Purpose(purpose), exclude=exclude)
+    return _config(Purpose(purpose), frozenset(() if exclude is None else exclude))
+
+
+@lru_cache(maxsize=None)
+def _config(purpose: Purpose, exclude: frozenset[str]) -> DTOConfig:
+    return DTOConfig(purpose=purpose, exclude=exclude)
 
 
 def field(
@@ -38,6 +38,19 @@ class AbstractRepository(Generic[T], metaclass=ABCMeta):
             The added instance.
         """
 
+    async def add_many(self, data: list[T]) -> list[T]:
+        """Add many instances of `data` to the collection.
+
+        Adds each instance with `add()`, implementations can override this with a bulk operation.
+
+        Args:
+            data: Instances to be added to the collection.
+
+        Returns:
+            The added instances.
+        """
+        return [await self.add(instance) for instance in data]
+
     @abstractmethod
     async def delete(self, id_: Any) -> T:
         """Delete instance identified by `id_`.
@@ -2,12 +2,25 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeVar, cast
 
-from sqlalchemy import select, text
+from asyncpg.exceptions import IntegrityConstraintViolationError, PostgresError
+from sqlalchemy import inspect, select, text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import (
+    immediateload,
+    joinedload,
+    noload,
+    raiseload,
+    selectinload,
+    subqueryload,
+)
 
-from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
+from starlite_saqlalchemy.exceptions import (
+    ConflictError,
+    NotFoundError,
+    StarliteSaqlalchemyError,
+)
 from starlite_saqlalchemy.repository.abc import AbstractRepository
 from starlite_saqlalchemy.repository.filters import (
     BeforeAfter,
@@ -17,11 +30,15 @@ from starlite_saqlalchemy.repository.filters import (
 
 if TYPE_CHECKING:
     from collections import abc
+    from collections.abc import Callable
     from datetime import datetime
 
-    from sqlalchemy import Select
+    from asyncpg import Connection
+    from sqlalchemy import Select, Table
     from sqlalchemy.engine import Result
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+    from sqlalchemy.orm import InstanceState, Mapper
+    from sqlalchemy.orm.interfaces import ORMOption
 
     from starlite_saqlalchemy.db import orm
     from starlite_saqlalchemy.repository.types import FilterTypes
@@ -57,9 +74,110 @@ def wrap_sqlalchemy_exception() -> Any:
         raise StarliteSaqlalchemyError(f"An exception occurred: {exc}") from exc
 
 
+_BASE_SELECTS: dict[tuple[type[Any], tuple[ORMOption, ...]], Select[tuple[Any]]] = {}
+_LOADER_OPTIONS: dict[tuple[type[Any], tuple[ORMOption, ...]], tuple[ORMOption, ...]] = {}
+_MODEL_ATTRIBUTES: dict[tuple[type[Any], str], Any] = {}
+_PRIMARY_KEY_ATTRIBUTES: dict[type[Any], str | None] = {}
+
+
+_EAGER_LOADERS: dict[str | bool | None, Callable[..., ORMOption]] = {
+    "immediate": immediateload,
+    "joined": joinedload,
+    False: joinedload,
+    "selectin": selectinload,
+    "subquery": subqueryload,
+    "noload": noload,
+    None: noload,
+}
+"""Loader option for each `relationship(lazy=...)` strategy, including SQLAlchemy's aliases,
+that `raiseload("*")` would otherwise override."""
+
+
+def _loader_options(model_type: type[Any], options: tuple[ORMOption, ...]) -> tuple[ORMOption, ...]:
+    """Build the loader options for `model_type` once per model type and `options`.
+
+    Eager loading strategies configured on the model's relationships are applied ahead of
+    `options`, so that they aren't overridden by a wildcard option such as `raiseload("*")`.
+    """
+    key = (model_type, options)
+    if key not in _LOADER_OPTIONS:
+        mapper = cast("Mapper", inspect(model_type))
+        _LOADER_OPTIONS[key] = (
+            *(
+                _EAGER_LOADERS[rel.lazy](getattr(model_type, rel.key))
+                for rel in mapper.relationships
+                if rel.lazy in _EAGER_LOADERS
+            ),
+            *options,
+        )
+    return _LOADER_OPTIONS[key]
+
+
+def _base_select(model_type: type[Any], options: tuple[ORMOption, ...]) -> Select[tuple[Any]]:
+    """Build the default select statement once per model type and loader options.
+
+    `Select` is immutable under generative methods, so the same instance is safely shared.
+    """
+    key = (model_type, options)
+    if key not in _BASE_SELECTS:
+        _BASE_SELECTS[key] = select(model_type).options(*_loader_options(model_type, options))
+    return _BASE_SELECTS[key]
+
+
+def _model_attribute(model_type: type[Any], name: str) -> Any:
+    """Resolve, and cache, the instrumented attribute `name` on `model_type`."""
+    key = (model_type, name)
+    if key not in _MODEL_ATTRIBUTES:
+        _MODEL_ATTRIBUTES[key] = getattr(model_type, name)
+    return _MODEL_ATTRIBUTES[key]
+
+
+def _primary_key_attribute(model_type: type[Any]) -> str | None:
+    """Name of the attribute mapped to the primary key of `model_type`, if it is a single
+    column."""
+    if model_type not in _PRIMARY_KEY_ATTRIBUTES:
+        mapper = cast("Mapper", inspect(model_type))
+        _PRIMARY_KEY_ATTRIBUTES[model_type] = (
+            mapper.get_property_by_column(mapper.primary_key[0]).key
+            if len(mapper.primary_key) == 1
+            else None
+        )
+    return _PRIMARY_KEY_ATTRIBUTES[model_type]
+
+
 class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
     """SQLAlchemy based implementation of the repository interface."""
 
+    default_options: ClassVar[tuple[ORMOption, ...]] = (raiseload("*"),)
+    """Loader options applied to the default select statement.
+
+    Relationships raise on access unless they are configured with an eager loading strategy, e.g.,
+    `relationship_selectin()`, or a subclass explicitly opts in to loading them, e.g.,
+    `default_options = (selectinload(Model.children), raiseload("*"))`.
+    """
+    copy_threshold: ClassVar[int] = 100
+    """`add_many()` uses `COPY` on asyncpg connections when given more instances than this."""
+    _filter_handlers: ClassVar[dict[type[Any], Callable[[Any, Any], None]]] = {
+        LimitOffset: lambda self, f: self._apply_limit_offset_pagination(f.limit, f.offset),
+        BeforeAfter: lambda self, f: self._filter_on_datetime_field(
+            f.field_name, f.before, f.after
+        ),
+        CollectionFilter: lambda self, f: self._filter_in_collection(f.field_name, f.values),
+    }
+    """Applies each supported filter type to the select statement."""
+    _id_column: ClassVar[Any]
+    """The `model_type` attribute named by `id_attribute`."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the identifier attribute once per repository type.
+
+        Args:
+            kwargs: Passed to `super().__init_subclass__()`
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "model_type"):
+            cls._id_column = getattr(cls.model_type, cls.id_attribute)
+
     def __init__(
         self, *, session: AsyncSession, select_: Select[tuple[ModelT]] | None = None, **kwargs: Any
     ) -> None:
@@ -70,7 +188,12 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         """
         super().__init__(**kwargs)
         self.session = session
-        self._select = select(self.model_type) if select_ is None else select_
+        # instances returned by `get()`, lives as long as the repository, which is request scoped
+        self._get_cache: dict[Any, ModelT] = {}
+        self._default_select: Select[tuple[ModelT]] | None = None
+        if select_ is None:
+            select_ = self._default_select = _base_select(self.model_type, self.default_options)
+        self._select = select_
 
     async def add(self, data: ModelT) -> ModelT:
         """Add `data` to the collection.
@@ -84,10 +207,40 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         with wrap_sqlalchemy_exception():
             instance = await self._attach_to_session(data)
             await self.session.flush()
-            await self.session.refresh(instance)
+            await self._refresh_unloaded(instance)
             self.session.expunge(instance)
             return instance
 
+    async def add_many(self, data: list[ModelT]) -> list[ModelT]:
+        """Add many instances of `data` to the collection.
+
+        On asyncpg connections, batches larger than `copy_threshold` are written with a single
+        `COPY` statement. Python-side column defaults are applied to the instances before they are
+        written, but the instances are not refreshed from the database. Batches of instances that
+        have related objects set are always flushed through the session, so that relationship
+        cascades and foreign key values are handled.
+
+        Args:
+            data: Instances to be added to the collection.
+
+        Returns:
+            The added instances.
+        """
+        with wrap_sqlalchemy_exception():
+            connection = await self.session.connection()
+            if (
+                connection.dialect.driver == "asyncpg"
+                and len(data) > self.copy_threshold
+                and self._supports_copy(data)
+            ):
+                await self._copy_records(connection, data)
+                return data
+            self.session.add_all(data)
+            await self.session.flush()
+            for instance in data:
+                self.session.expunge(instance)
+            return data
+
     async def delete(self, id_: Any) -> ModelT:
         """Delete instance identified by `id_`.
 
@@ -101,7 +254,10 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
         with wrap_sqlalchemy_exception():
+            # delete a freshly loaded instance, and don't hold on to it afterwards
+            self._get_cache.pop(id_, None)
             instance = await self.get(id_)
+            self._get_cache.pop(id_, None)
             await self.session.delete(instance)
             await self.session.flush()
             self.session.expunge(instance)
@@ -114,16 +270,28 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             id_: Identifier of the instance to be retrieved.
 
         Returns:
-            The retrieved instance.
+            The retrieved instance. Repeated calls for the same `id_` return the same instance,
+            until it is updated or deleted through this repository.
 
         Raises:
             RepositoryNotFoundException: If no instance found identified by `id_`.
         """
+        if id_ in self._get_cache:
+            return self._get_cache[id_]
         with wrap_sqlalchemy_exception():
-            self._filter_select_by_kwargs(**{self.id_attribute: id_})
-            instance = (await self._execute()).scalar_one_or_none()
+            if self._is_primary_key_lookup():
+                # identity map lookup, falling back to the mapper's cached primary key query
+                instance = await self.session.get(
+                    self.model_type,
+                    id_,
+                    options=_loader_options(self.model_type, self.default_options),
+                )
+            else:
+                self._select = self._select.where(self._id_column == id_)
+                instance = (await self._execute()).scalar_one_or_none()
             instance = self.check_not_found(instance)
             self.session.expunge(instance)
+            self._get_cache[id_] = instance
             return instance
 
     async def list(self, *filters: FilterTypes, **kwargs: Any) -> list[ModelT]:
@@ -137,22 +305,17 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             The list of instances, after filtering applied.
         """
         for filter_ in filters:
-            match filter_:
-                case LimitOffset(limit, offset):
-                    self._apply_limit_offset_pagination(limit, offset)
-                case BeforeAfter(field_name, before, after):
-                    self._filter_on_datetime_field(field_name, before, after)
-                case CollectionFilter(field_name, values):
-                    self._filter_in_collection(field_name, values)
-                case _:
-                    raise StarliteSaqlalchemyError(f"Unexpected filter: {filter}")
+            handler = self._filter_handler(type(filter_))
+            if handler is None:
+                raise StarliteSaqlalchemyError(f"Unexpected filter: {filter_}")
+            handler(self, filter_)
         self._filter_select_by_kwargs(**kwargs)
 
         with wrap_sqlalchemy_exception():
             result = await self._execute()
-            instances = list(result.scalars())
-            for instance in instances:
-                self.session.expunge(instance)
+            instances = cast("list[ModelT]", result.scalars().all())
+            # session is scoped to the request, so nothing else should be attached to it
+            self.session.expunge_all()
             return instances
 
     async def update(self, data: ModelT) -> ModelT:
@@ -168,14 +331,21 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found with same identifier as `data`.
         """
+        self._get_cache.pop(self.get_id_attribute_value(data), None)
         with wrap_sqlalchemy_exception():
-            id_ = self.get_id_attribute_value(data)
-            # this will raise for not found, and will put the item in the session
-            await self.get(id_)
-            # this will merge the inbound data to the instance we just put in the session
+            pending_before = {id(obj) for obj in self.session.new}
+            # merge loads the existing instance and applies the inbound data to it
             instance = await self._attach_to_session(data, strategy="merge")
+            if cast("InstanceState[ModelT]", inspect(instance)).pending:
+                # there was nothing to merge into, so merge created a new instance, and cascaded
+                # any related objects into the session along with it
+                for obj in list(self.session.new):
+                    if id(obj) not in pending_before:
+                        self.session.expunge(obj)
+                raise NotFoundError("No item found when one was expected")
+            self._expire_stale_relationships(instance)
             await self.session.flush()
-            await self.session.refresh(instance)
+            await self._refresh_unloaded(instance)
             self.session.expunge(instance)
             return instance
 
@@ -196,10 +366,12 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Raises:
             RepositoryNotFoundException: If no instance found with same identifier as `data`.
         """
+        self._get_cache.pop(self.get_id_attribute_value(data), None)
         with wrap_sqlalchemy_exception():
             instance = await self._attach_to_session(data, strategy="merge")
+            self._expire_stale_relationships(instance)
             await self.session.flush()
-            await self.session.refresh(instance)
+            await self._refresh_unloaded(instance)
             self.session.expunge(instance)
             return instance
 
@@ -256,23 +428,132 @@ class SQLAlchemyRepository(AbstractRepository[ModelT], Generic[ModelT]):
             case _:
                 raise ValueError("Unexpected value for `strategy`, must be `'add'` or `'merge'`")
 
+    async def _copy_records(self, connection: AsyncConnection, data: abc.Iterable[ModelT]) -> None:
+        """Write `data` to the model table using asyncpg's `copy_records_to_table()`."""
+        column_attrs = cast("Mapper", inspect(self.model_type)).column_attrs
+        records = []
+        for instance in data:
+            record = []
+            for attr in column_attrs:
+                value = getattr(instance, attr.key)
+                default = attr.columns[0].default
+                if value is None and default is not None:
+                    value = default.arg if default.is_scalar else default.arg({})
+                    setattr(instance, attr.key, value)
+                record.append(value)
+            records.append(tuple(record))
+        table = cast("Table", self.model_type.__table__)
+        raw_connection = await connection.get_raw_connection()
+        # SQLAlchemy's asyncpg adapter begins its transaction lazily, on the first statement it
+        # executes, so do the same here, under the adapter's lock, or the `COPY` would autocommit
+        adapted_connection = cast("Any", raw_connection.dbapi_connection)
+        # errors from the driver aren't wrapped by SQLAlchemy, so map them the same way here
+        try:
+            async with adapted_connection._execute_mutex:
+                if not adapted_connection._started:
+                    await adapted_connection._start_transaction()
+                await cast("Connection", raw_connection.driver_connection).copy_records_to_table(
+                    table.name,
+                    records=records,
+                    columns=[attr.columns[0].name for attr in column_attrs],
+                    schema_name=table.schema,
+                )
+        except IntegrityConstraintViolationError as exc:
+            raise ConflictError from exc
+        except PostgresError as exc:
+            raise StarliteSaqlalchemyError(f"An exception occurred: {exc}") from exc
+
+    @classmethod
+    def _filter_handler(cls, filter_type: type[Any]) -> Callable[[Any, Any], None] | None:
+        """Handler for `filter_type`, or the nearest of its bases that has one.
+
+        Handlers resolved through a base are stored against `filter_type`, so the MRO is only
+        walked once per filter type.
+        """
+        if filter_type in cls._filter_handlers:
+            return cls._filter_handlers[filter_type]
+        for base in filter_type.__mro__[1:]:
+            if base in cls._filter_handlers:
+                handler = cls._filter_handlers[filter_type] = cls._filter_handlers[base]
+                return handler
+        return None
+
     async def _execute(self) -> Result[tuple[ModelT, ...]]:
         return await self.session.execute(self._select)
 
+    def _expire_stale_relationships(self, instance: ModelT) -> None:
+        """Expire relationships of `instance` whose foreign key columns have been changed.
+
+        Otherwise, a relationship loaded before the change would still refer to the previous
+        related object after the flush, as only unloaded attributes are refreshed.
+        """
+        state = cast("InstanceState[ModelT]", inspect(instance))
+        mapper = state.mapper
+        stale = [
+            rel.key
+            for rel in mapper.relationships
+            if not state.attrs[rel.key].history.has_changes()
+            and any(
+                state.attrs[mapper.get_property_by_column(column).key].history.has_changes()
+                for column in rel.local_columns
+            )
+        ]
+        if stale:
+            self.session.expire(instance, stale)
+
     def _filter_in_collection(self, field_name: str, values: abc.Collection[Any]) -> None:
         if not values:
             return
-        self._select = self._select.where(getattr(self.model_type, field_name).in_(values))
+        self._select = self._select.where(_model_attribute(self.model_type, field_name).in_(values))
 
     def _filter_on_datetime_field(
         self, field_name: str, before: datetime | None, after: datetime | None
     ) -> None:
-        field = getattr(self.model_type, field_name)
+        field = _model_attribute(self.model_type, field_name)
+        conditions = []
         if before is not None:
-            self._select = self._select.where(field < before)
+            conditions.append(field < before)
         if after is not None:
-            self._select = self._select.where(field > before)
+            conditions.append(field > after)
+        if conditions:
+            self._select = self._select.where(*conditions)
 
     def _filter_select_by_kwargs(self, **kwargs: Any) -> None:
         for key, val in kwargs.items():
-            self._select = self._select.where(getattr(self.model_type, key) == val)
+            self._select = self._select.where(_model_attribute(self.model_type, key) == val)
+
+    def _is_primary_key_lookup(self) -> bool:
+        """Lookups by `id_attribute` can use `Session.get()` if the repository select is the
+        default, and `id_attribute` is the primary key."""
+        return self._select is self._default_select and self.id_attribute == _primary_key_attribute(
+            self.model_type
+        )
+
+    async def _refresh_unloaded(self, instance: ModelT) -> None:
+        """Load any attributes of `instance` that weren't populated by the flush.
+
+        Server-generated column values are returned by the flush (see `eager_defaults`), so this
+        only costs a round-trip when, e.g., a relationship hasn't been set on the instance.
+        """
+        unloaded = cast("InstanceState[ModelT]", inspect(instance)).unloaded
+        if unloaded:
+            await self.session.refresh(instance, attribute_names=unloaded)
+
+    def _supports_copy(self, data: abc.Iterable[ModelT]) -> bool:
+        """`COPY` bypasses SQL-side defaults and the unit of work, so only use it when all
+        defaults are Python-side, and no instance in `data` has related objects set."""
+        table = cast("Table", self.model_type.__table__)
+        if table.autoincrement_column is not None:
+            return False
+        if not all(
+            column.server_default is None
+            and (column.default is None or column.default.is_scalar or column.default.is_callable)
+            for column in table.columns
+        ):
+            return False
+        relationship_keys = cast("Mapper", inspect(self.model_type)).relationships.keys()
+        return not any(
+            cast("InstanceState[ModelT]", inspect(instance)).dict.get(key)
+            for instance in data
+            for key in relationship_keys
+        )
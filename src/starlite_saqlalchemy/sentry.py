@@ -33,11 +33,22 @@ def sentry_traces_sampler(sampling_context: Mapping[str, Any]) -> float:
     return settings.sentry.TRACES_SAMPLE_RATE
 
 
+_INITIALIZED = False
+"""Set once `configure()` has initialized the SDK."""
+
+
 def configure(traces_sampler: TracesSampler | None = None) -> None:
     """Configure sentry on app startup.
 
+    Only the first call initializes the SDK, subsequent calls are no-ops. This prevents the
+    integrations from being installed again if both the app and worker are configured in the same
+    process.
+
     See [SentrySettings][starlite_saqlalchemy.settings.SentrySettings].
     """
+    global _INITIALIZED  # pylint: disable=global-statement
+    if _INITIALIZED:
+        return
     sentry_sdk.init(
         dsn=settings.sentry.DSN,
         environment=settings.app.ENVIRONMENT,
@@ -45,3 +56,4 @@ def configure(traces_sampler: TracesSampler | None = None) -> None:
         integrations=[StarliteIntegration(), SqlalchemyIntegration()],
         traces_sampler=sentry_traces_sampler if traces_sampler is None else traces_sampler,
     )
+    _INITIALIZED = True
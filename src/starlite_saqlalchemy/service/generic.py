@@ -5,6 +5,7 @@ Service object is generic on the domain model type.
 from __future__ import annotations
 
 import contextlib
+import sys
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
 from starlite_saqlalchemy import constants
@@ -30,9 +31,10 @@ class Service(Generic[T]):
         application instances, e.g., using something like `hash()` or
         `id()` won't work as those would be different on different
         instances of the running application. So we use the full import
-        path to the object.
+        path to the object. The id is interned as it is used as the key
+        for lookups in `constants.SERVICE_OBJECT_IDENTITY_MAP`.
         """
-        cls.__id__ = f"{cls.__module__}.{cls.__name__}"
+        cls.__id__ = sys.intern(f"{cls.__module__}.{cls.__name__}")
         # error: Argument of type "Type[Self@Service[T@Service]]" cannot be assigned to parameter
         #       "__value" of type "Type[Service[Any]]" in function "__setitem__"
         #   "Type[Service[T@Service]]" is incompatible with "Type[Service[Any]]"
@@ -5,16 +5,20 @@ Uses a `dict` for storage.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Generic, TypeVar
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 from uuid import uuid4
 
+from sqlalchemy import inspect
+
 from starlite_saqlalchemy.db import orm
 from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
 from starlite_saqlalchemy.repository.abc import AbstractRepository
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Hashable, Iterable, MutableMapping
-    from typing import Any
+
+    from sqlalchemy.orm import Mapper
 
     from starlite_saqlalchemy.repository.types import FilterTypes
 
@@ -22,6 +26,56 @@ ModelT = TypeVar("ModelT", bound=orm.Base | orm.AuditBase)
 MockRepoT = TypeVar("MockRepoT", bound="GenericMockRepository")
 
 
+class _Collection(dict[Any, Any]):
+    """A `dict` that caches a list of its values until it is mutated.
+
+    The cache lives on the collection itself, so it is shared by every repository type that
+    shares the collection, and is invalidated by writes made directly to the collection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: list[Any] | None = None
+
+    def values_list(self) -> list[Any]:
+        """The values of the collection, as a list that must not be mutated."""
+        if self._values is None:
+            self._values = list(self.values())
+        return self._values
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._values = None
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._values = None
+
+    def __ior__(self, other: Any) -> _Collection:  # type:ignore[misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._values = None
+
+    def pop(self, *args: Any) -> Any:
+        self._values = None
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        self._values = None
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._values = None
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._values = None
+
+
 class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
     """A repository implementation for tests.
 
@@ -30,11 +84,28 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
 
     collection: MutableMapping[Hashable, ModelT]
     model_type: type[ModelT]
+    _has_audit_columns: ClassVar[bool] = False
+    """If `model_type` has `created` and `updated` attributes."""
+    _attribute_keys: ClassVar[tuple[str, ...] | None] = None
+    """Names of the mapped attributes of `model_type`, resolved on first `update()`."""
 
     def __init__(self, id_factory: Callable[[], Any] = uuid4, **_: Any) -> None:
         super().__init__()
         self._id_factory = id_factory
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Inspect `model_type` once per repository type, rather than per instance.
+
+        Args:
+            kwargs: Passed to `super().__init_subclass__()`
+        """
+        super().__init_subclass__(**kwargs)
+        model_type = getattr(cls, "model_type", None)
+        cls._has_audit_columns = hasattr(model_type, "created") and hasattr(model_type, "updated")
+        # resolving the attributes configures the mappers, which can't be done until every model
+        # that `model_type` has relationships with is defined
+        cls._attribute_keys = None
+
     @classmethod
     def __class_getitem__(cls: type[MockRepoT], item: type[ModelT]) -> type[MockRepoT]:
         """Add collection to `_collections` for the type.
@@ -43,7 +114,9 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
             item: The type that the class has been parametrized with.
         """
         return type(  # pyright:ignore
-            f"{cls.__name__}[{item.__name__}]", (cls,), {"collection": {}, "model_type": item}
+            f"{cls.__name__}[{item.__name__}]",
+            (cls,),
+            {"collection": _Collection(), "model_type": item},
         )
 
     def _find_or_raise_not_found(self, id_: Any) -> ModelT:
@@ -61,10 +134,10 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
         """
         if allow_id is False and self.get_id_attribute_value(data) is not None:
             raise ConflictError("`add()` received identified item.")
-        now = datetime.now()
-        if hasattr(data, "updated") and hasattr(data, "created"):
+        if self._has_audit_columns:
+            now = datetime.now()
             # maybe the @declarative_mixin decorator doesn't play nice with pyright?
-            data.updated = data.created = now  # pyright: ignore
+            data.updated = data.created = now  # type:ignore[union-attr]  # pyright: ignore
         if allow_id is False:
             id_ = self._id_factory()
             self.set_id_attribute_value(id_, data)
@@ -110,8 +183,11 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
             **kwargs: Instance attribute value filters.
 
         Returns:
-            The list of instances, after filtering applied.
+            The list of instances, after filtering applied. The list is cached until the members
+            of the collection change, so must not be mutated by the caller.
         """
+        if isinstance(self.collection, _Collection):
+            return self.collection.values_list()
         return list(self.collection.values())
 
     async def update(self, data: ModelT) -> ModelT:
@@ -129,13 +205,18 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
         """
         item = self._find_or_raise_not_found(self.get_id_attribute_value(data))
         # should never be modifiable
-        if hasattr(data, "updated"):
+        if self._has_audit_columns:
             # maybe the @declarative_mixin decorator doesn't play nice with pyright?
-            data.updated = datetime.now()  # pyright: ignore
-        for key, val in data.__dict__.items():
-            if key.startswith("_"):
-                continue
-            setattr(item, key, val)
+            data.updated = datetime.now()  # type:ignore[union-attr]  # pyright: ignore
+        attribute_keys = type(self)._attribute_keys
+        if attribute_keys is None:
+            attribute_keys = type(self)._attribute_keys = tuple(
+                cast("Mapper", inspect(self.model_type)).attrs.keys()
+            )
+        values = vars(data)
+        for key in attribute_keys:
+            if key in values:
+                setattr(item, key, values[key])
         return item
 
     async def upsert(self, data: ModelT) -> ModelT:
@@ -167,10 +248,15 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
             **kwargs: key/value pairs such that objects remaining in the collection after filtering
                 have the property that their attribute named `key` has value equal to `value`.
         """
-        new_collection: dict[Hashable, ModelT] = {}
+        if not kwargs:
+            return
+        # `attrgetter()` returns a tuple when given multiple names, and the bare value for one
+        getter = attrgetter(*kwargs)
+        target = tuple(kwargs.values()) if len(kwargs) > 1 else next(iter(kwargs.values()))
+        new_collection: MutableMapping[Hashable, ModelT] = _Collection()
         for item in self.collection.values():
             try:
-                if all(getattr(item, name) == value for name, value in kwargs.items()):
+                if getter(item) == target:
                     new_collection[item.id] = item
             except AttributeError as orig:
                 raise StarliteSaqlalchemyError from orig
@@ -183,10 +269,10 @@ class GenericMockRepository(AbstractRepository[ModelT], Generic[ModelT]):
         Args:
             instances: the instances to be added to the collection.
         """
-        for instance in instances:
-            cls.collection[cls.get_id_attribute_value(instance)] = instance
+        getter = attrgetter(cls.id_attribute)
+        cls.collection.update((getter(instance), instance) for instance in instances)
 
     @classmethod
     def clear_collection(cls) -> None:
         """Empty the collection for repository type."""
-        cls.collection = {}
+        cls.collection = _Collection()
@@ -1,17 +1,19 @@
 """Config that can be shared between all test types."""
 from __future__ import annotations
 
-import importlib
+import importlib.abc
+import importlib.util
+import itertools
 import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, TypeVar
-from uuid import uuid4
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-    from pathlib import Path
-    from types import ModuleType
+    from collections.abc import Callable, Mapping
+    from types import CodeType, ModuleType
     from typing import Any
 
     from pytest import MonkeyPatch
@@ -21,45 +23,91 @@ if TYPE_CHECKING:
 pytest_plugins = ("pytest_dotenv", "pytest_starlite_saqlalchemy.plugin")
 
 
-@pytest.fixture(name="raw_authors")
-def fx_raw_authors() -> list[dict[str, Any]]:
-    """Unstructured author representations."""
-
-    return [
+_RAW_AUTHORS = (
+    MappingProxyType(
         {
             "id": "97108ac1-ffcb-411d-8b1e-d9183399f63b",
             "name": "Agatha Christie",
             "dob": "1890-09-15",
             "created": "0001-01-01T00:00:00",
             "updated": "0001-01-01T00:00:00",
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "id": "5ef29f3c-3560-4d15-ba6b-a2e5c721e4d2",
             "name": "Leo Tolstoy",
             "dob": "1828-09-09",
             "created": "0001-01-01T00:00:00",
             "updated": "0001-01-01T00:00:00",
-        },
-    ]
-
-
-@pytest.fixture(name="raw_books")
-def fx_raw_books(raw_authors: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Unstructured book representations."""
-    return [
+        }
+    ),
+)
+_RAW_BOOKS = (
+    MappingProxyType(
         {
             "id": "f34545b9-663c-4fce-915d-dd1ae9cea42a",
             "title": "Murder on the Orient Express",
             "author_id": "97108ac1-ffcb-411d-8b1e-d9183399f63b",
-            "author": raw_authors[0],
+            "author": _RAW_AUTHORS[0],
             "created": "0001-01-01T00:00:00",
             "updated": "0001-01-01T00:00:00",
-        },
-    ]
+        }
+    ),
+)
+
+
+@pytest.fixture(name="raw_authors", scope="session")
+def fx_raw_authors() -> tuple[Mapping[str, Any], ...]:
+    """Unstructured author representations.
+
+    Shared by all tests, so they are read-only.
+    """
+    return _RAW_AUTHORS
+
+
+@pytest.fixture(name="raw_books", scope="session")
+def fx_raw_books() -> tuple[Mapping[str, Any], ...]:
+    """Unstructured book representations.
+
+    Shared by all tests, so they are read-only.
+    """
+    return _RAW_BOOKS
+
+
+_MODULE_COUNTER = itertools.count()
+"""Numbers the modules made by `create_module`."""
+
+
+_T = TypeVar("_T")
+
+
+def _not_none(val: _T | None) -> _T:
+    assert val is not None
+    return val
+
+
+@lru_cache(maxsize=128)
+def _compile(source: str) -> CodeType:
+    """Compile module source, once per distinct source."""
+    return compile(source, "<create_module>", "exec")
+
+
+class _SourceLoader(importlib.abc.InspectLoader):
+    """Loads a module from source code held in memory."""
+
+    def __init__(self, source: str) -> None:
+        self._source = source
+
+    def get_source(self, fullname: str) -> str:
+        return self._source
+
+    def get_code(self, fullname: str) -> CodeType:
+        return _compile(self._source)
 
 
 @pytest.fixture(name="create_module")
-def fx_create_module(tmp_path: Path, monkeypatch: MonkeyPatch) -> Callable[[str], ModuleType]:
+def fx_create_module(monkeypatch: MonkeyPatch) -> Callable[[str], ModuleType]:
     """Utility fixture for dynamic module creation."""
 
     def wrapped(source: str) -> ModuleType:
@@ -71,20 +119,11 @@ def fx_create_module(tmp_path: Path, monkeypatch: MonkeyPatch) -> Callable[[str]
         Returns:
             An imported module.
         """
-        T = TypeVar("T")
-
-        def not_none(val: T | None) -> T:
-            assert val is not None
-            return val
-
-        module_name = uuid4().hex
-        path = tmp_path / f"{module_name}.py"
-        path.write_text(source)
-        # https://docs.python.org/3/library/importlib.html#importing-a-source-file-directly
-        spec = not_none(importlib.util.spec_from_file_location(module_name, path))  # pyright:ignore
-        module = not_none(importlib.util.module_from_spec(spec))  # pyright:ignore
+        module_name = f"_create_module_{next(_MODULE_COUNTER)}"
+        spec = _not_none(importlib.util.spec_from_loader(module_name, _SourceLoader(source)))
+        module = importlib.util.module_from_spec(spec)
         monkeypatch.setitem(sys.modules, module_name, module)
-        not_none(spec.loader).exec_module(module)
+        _not_none(spec.loader).exec_module(module)
         return module
 
     return wrapped
@@ -23,7 +23,7 @@ from starlite_saqlalchemy.health import AppHealthCheck, HealthController
 from starlite_saqlalchemy.sqlalchemy_plugin import SQLAlchemyHealthCheck
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
     from typing import Any
 
     from pytest_docker.plugin import Services  # type:ignore[import]
@@ -165,26 +165,36 @@ async def fx_engine(docker_ip: str) -> AsyncEngine:
     )
 
 
+@pytest.fixture(name="author_rows", scope="session")
+def fx_author_rows(raw_authors: tuple[Mapping[str, Any], ...]) -> list[dict[str, Any]]:
+    """Author table rows, with the date/time strings of `raw_authors` converted to dt
+    objects."""
+    return [
+        {
+            **raw_author,
+            "dob": datetime.strptime(raw_author["dob"], "%Y-%m-%d"),
+            "created": datetime.strptime(raw_author["created"], "%Y-%m-%dT%H:%M:%S"),
+            "updated": datetime.strptime(raw_author["updated"], "%Y-%m-%dT%H:%M:%S"),
+        }
+        for raw_author in raw_authors
+    ]
+
+
 @pytest.fixture(autouse=True)
-async def _seed_db(engine: AsyncEngine, raw_authors: list[dict[str, Any]]) -> AsyncIterator[None]:
+async def _seed_db(engine: AsyncEngine, author_rows: list[dict[str, Any]]) -> AsyncIterator[None]:
     """Populate test database with.
 
     Args:
         engine: The SQLAlchemy engine instance.
+        author_rows: Rows to insert into the author table.
     """
     metadata = db.orm.Base.registry.metadata
     author_table = metadata.tables["author"]
     async with engine.begin() as conn:
         await conn.run_sync(metadata.create_all)
 
-    # convert date/time strings to dt objects.
-    for raw_author in raw_authors:
-        raw_author["dob"] = datetime.strptime(raw_author["dob"], "%Y-%m-%d")
-        raw_author["created"] = datetime.strptime(raw_author["created"], "%Y-%m-%dT%H:%M:%S")
-        raw_author["updated"] = datetime.strptime(raw_author["updated"], "%Y-%m-%dT%H:%M:%S")
-
     async with engine.begin() as conn:
-        await conn.execute(author_table.insert(), raw_authors)
+        await conn.execute(author_table.insert(), author_rows)
     yield
     async with engine.begin() as conn:
         await conn.run_sync(metadata.drop_all)
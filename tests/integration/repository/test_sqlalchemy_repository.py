@@ -1,8 +1,19 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+from uuid import UUID
+
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from starlite_saqlalchemy.exceptions import StarliteSaqlalchemyError
-from tests.utils.domain import authors
+from tests.utils.domain import authors, books
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
 
 
 @pytest.fixture(name="session")
@@ -18,3 +29,54 @@ def fx_repo(session: AsyncSession) -> authors.Repository:
 def test_filter_by_kwargs_with_incorrect_attribute_name(repo: authors.Repository) -> None:
     with pytest.raises(StarliteSaqlalchemyError):
         repo.filter_collection_by_kwargs(whoops="silly me")
+
+
+async def test_get_loads_eager_relationships(engine: AsyncEngine) -> None:
+    async with async_sessionmaker(bind=engine)() as session:
+        book = books.Book(
+            title="Murder on the Orient Express",
+            author_id=UUID("97108ac1-ffcb-411d-8b1e-d9183399f63b"),
+        )
+        session.add(book)
+        await session.flush()
+        book_id = book.id
+        await session.commit()
+
+    async with async_sessionmaker(bind=engine)() as session:
+        instance = await books.Repository(session=session).get(book_id)
+    assert instance.author.name == "Agatha Christie"
+
+
+async def test_add_many_copy_rolled_back_with_session(
+    engine: AsyncEngine, raw_authors: tuple[Mapping[str, Any], ...]
+) -> None:
+    async with async_sessionmaker(bind=engine)() as session:
+        repo = authors.Repository(session=session)
+        await repo.add_many(
+            [
+                authors.Author(name=str(i), dob=date(1900, 1, 1))
+                for i in range(repo.copy_threshold + 1)
+            ]
+        )
+        await session.rollback()
+
+    async with async_sessionmaker(bind=engine)() as session:
+        count = await session.scalar(select(func.count()).select_from(authors.Author))
+    assert count == len(raw_authors)
+
+
+async def test_update_reloads_relationship_of_changed_foreign_key(engine: AsyncEngine) -> None:
+    async with async_sessionmaker(bind=engine)() as session:
+        book = books.Book(
+            title="War and Peace", author_id=UUID("97108ac1-ffcb-411d-8b1e-d9183399f63b")
+        )
+        session.add(book)
+        await session.flush()
+        book_id = book.id
+        await session.commit()
+
+    async with async_sessionmaker(bind=engine)() as session:
+        instance = await books.Repository(session=session).update(
+            books.Book(id=book_id, author_id=UUID("5ef29f3c-3560-4d15-ba6b-a2e5c721e4d2"))
+        )
+    assert instance.author.name == "Leo Tolstoy"
@@ -1,32 +1,59 @@
 """Unit test specific config."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, cast
 
 import pytest
 from starlite import get
 from starlite.datastructures import State
 from starlite.enums import ScopeType
+from starlite.testing import RequestFactory
 
 if TYPE_CHECKING:
     from starlite import Starlite
     from starlite.types import HTTPResponseBodyEvent, HTTPResponseStartEvent, HTTPScope
 
 
-@pytest.fixture()
+_HTTP_RESPONSE_START = MappingProxyType(
+    {"type": "http.response.start", "status": 200, "headers": ()}
+)
+_HTTP_RESPONSE_BODY = MappingProxyType(
+    {"type": "http.response.body", "body": b"body", "more_body": False}
+)
+
+
+@pytest.fixture(scope="session")
 def http_response_start() -> HTTPResponseStartEvent:
-    """ASGI message for start of response."""
-    return {"type": "http.response.start", "status": 200, "headers": []}
+    """ASGI message for start of response.
+
+    Shared by all tests, so read-only. Use `mutable_http_response_start` to modify it.
+    """
+    return cast("HTTPResponseStartEvent", _HTTP_RESPONSE_START)
 
 
 @pytest.fixture()
+def mutable_http_response_start() -> HTTPResponseStartEvent:
+    """Copy of the `http_response_start` message that the test can modify."""
+    return cast("HTTPResponseStartEvent", dict(_HTTP_RESPONSE_START))
+
+
+@pytest.fixture(scope="session")
 def http_response_body() -> HTTPResponseBodyEvent:
     """ASGI message for interim, and final response body messages.
 
+    Shared by all tests, so read-only. Use `mutable_http_response_body` to modify it.
+
     Note:
         `more_body` is `True` for interim body messages.
     """
-    return {"type": "http.response.body", "body": b"body", "more_body": False}
+    return cast("HTTPResponseBodyEvent", _HTTP_RESPONSE_BODY)
+
+
+@pytest.fixture()
+def mutable_http_response_body() -> HTTPResponseBodyEvent:
+    """Copy of the `http_response_body` message that the test can modify."""
+    return cast("HTTPResponseBodyEvent", dict(_HTTP_RESPONSE_BODY))
 
 
 @pytest.fixture()
@@ -61,7 +88,16 @@ def http_scope(app: Starlite) -> HTTPScope:
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def state() -> State:
-    """Starlite application state datastructure."""
+    """Starlite application state datastructure.
+
+    Shared by all tests, so a test that modifies state should make its own, e.g., `State(state)`.
+    """
     return State()
+
+
+@pytest.fixture(scope="session")
+def request_factory() -> RequestFactory:
+    """Builds request objects for tests that need a `Request`."""
+    return RequestFactory()
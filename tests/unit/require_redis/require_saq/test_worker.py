@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock
 
 import pytest
 from asyncpg.pgproto import pgproto
@@ -10,11 +9,42 @@ from pydantic import BaseModel
 from saq import Job
 
 from starlite_saqlalchemy import service, worker
+from tests.utils import AsyncRecorder
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pytest import MonkeyPatch
 
 
+@pytest.fixture(name="_async_recorders", scope="module")
+def fx_async_recorders() -> dict[str, AsyncRecorder]:
+    """Recorders shared by the tests in this module, cleared for each test that uses them."""
+    return {"enqueue": AsyncRecorder(), "receive_callback": AsyncRecorder()}
+
+
+@pytest.fixture(name="enqueue_recorder")
+def fx_enqueue_recorder(
+    _async_recorders: dict[str, AsyncRecorder], monkeypatch: MonkeyPatch
+) -> AsyncRecorder:
+    """Patches `worker.queue.enqueue()`."""
+    enqueue_recorder = _async_recorders["enqueue"]
+    enqueue_recorder.calls.clear()
+    monkeypatch.setattr(worker.queue, "enqueue", enqueue_recorder)
+    return enqueue_recorder
+
+
+@pytest.fixture(name="receive_callback_recorder")
+def fx_receive_callback_recorder(
+    _async_recorders: dict[str, AsyncRecorder], monkeypatch: MonkeyPatch
+) -> AsyncRecorder:
+    """Patches a `receive_callback()` method onto `service.Service`."""
+    recv_cb_recorder = _async_recorders["receive_callback"]
+    recv_cb_recorder.calls.clear()
+    monkeypatch.setattr(service.Service, "receive_callback", recv_cb_recorder, raising=False)
+    return recv_cb_recorder
+
+
 def test_worker_decoder_handles_pgproto_uuid() -> None:
     """Test that the decoder can handle pgproto.UUID instances."""
     pg_uuid = pgproto.UUID("0448bde2-7c69-4e6b-9c03-7b217e3b563d")
@@ -36,22 +66,20 @@ def test_worker_decoder_handles_pydantic_models() -> None:
 
 
 async def test_make_service_callback(
-    raw_authors: list[dict[str, Any]], monkeypatch: MonkeyPatch
+    raw_authors: tuple[Mapping[str, Any], ...], receive_callback_recorder: AsyncRecorder
 ) -> None:
     """Tests loading and retrieval of service object types."""
-    recv_cb_mock = AsyncMock()
-    monkeypatch.setattr(service.Service, "receive_callback", recv_cb_mock, raising=False)
     await worker.make_service_callback(
         {},
         service_type_id="tests.utils.domain.authors.Service",
         service_method_name="receive_callback",
         raw_obj=raw_authors[0],
     )
-    recv_cb_mock.assert_called_once_with(raw_obj=raw_authors[0])
+    assert receive_callback_recorder.calls == [((), {"raw_obj": raw_authors[0]})]
 
 
 async def test_make_service_callback_raises_runtime_error(
-    raw_authors: list[dict[str, Any]]
+    raw_authors: tuple[Mapping[str, Any], ...]
 ) -> None:
     """Tests loading and retrieval of service object types."""
     with pytest.raises(KeyError):
@@ -63,17 +91,15 @@ async def test_make_service_callback_raises_runtime_error(
         )
 
 
-async def test_enqueue_service_callback(monkeypatch: MonkeyPatch) -> None:
+async def test_enqueue_service_callback(enqueue_recorder: AsyncRecorder) -> None:
     """Tests that job enqueued with desired arguments."""
-    enqueue_mock = AsyncMock()
-    monkeypatch.setattr(worker.queue, "enqueue", enqueue_mock)
     service_instance = service.Service[Any]()
     await worker.enqueue_background_task_for_service(
         service_instance, "receive_callback", raw_obj={"a": "b"}
     )
-    enqueue_mock.assert_called_once()
-    assert isinstance(enqueue_mock.mock_calls[0].args[0], Job)
-    job = enqueue_mock.mock_calls[0].args[0]
+    ((job,), _), *rest = enqueue_recorder.calls
+    assert not rest
+    assert isinstance(job, Job)
     assert job.function == worker.make_service_callback.__qualname__
     assert job.kwargs == {
         "service_type_id": "starlite_saqlalchemy.service.generic.Service",
@@ -82,10 +108,10 @@ async def test_enqueue_service_callback(monkeypatch: MonkeyPatch) -> None:
     }
 
 
-async def test_enqueue_service_callback_with_custom_job_config(monkeypatch: MonkeyPatch) -> None:
+async def test_enqueue_service_callback_with_custom_job_config(
+    enqueue_recorder: AsyncRecorder,
+) -> None:
     """Tests that job enqueued with desired arguments."""
-    enqueue_mock = AsyncMock()
-    monkeypatch.setattr(worker.queue, "enqueue", enqueue_mock)
     service_instance = service.Service[Any]()
     await worker.enqueue_background_task_for_service(
         service_instance,
@@ -93,9 +119,9 @@ async def test_enqueue_service_callback_with_custom_job_config(monkeypatch: Monk
         job_config=worker.JobConfig(timeout=999),
         raw_obj={"a": "b"},
     )
-    enqueue_mock.assert_called_once()
-    assert isinstance(enqueue_mock.mock_calls[0].args[0], Job)
-    job = enqueue_mock.mock_calls[0].args[0]
+    ((job,), _), *rest = enqueue_recorder.calls
+    assert not rest
+    assert isinstance(job, Job)
     assert job.function == worker.make_service_callback.__qualname__
     assert job.timeout == 999
     assert job.kwargs == {
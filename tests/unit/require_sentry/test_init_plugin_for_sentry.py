@@ -78,6 +78,7 @@ def test_sentry_init(
 ) -> None:
     sentry_init_mock = MagicMock()
     monkeypatch.setattr(sentry_sdk, "init", sentry_init_mock)
+    monkeypatch.setattr(sentry, "_INITIALIZED", False)
     init_plugin.ConfigureApp(
         config=init_plugin.PluginConfig(do_sentry=True, sentry_traces_sampler=traces_sampler)
     )
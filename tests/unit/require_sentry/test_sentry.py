@@ -1,12 +1,15 @@
 """Tests for sentry integration."""
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
+import sentry_sdk
 
-from starlite_saqlalchemy import settings
+from starlite_saqlalchemy import sentry, settings
 from starlite_saqlalchemy.sentry import SamplingContext, sentry_traces_sampler
 
 if TYPE_CHECKING:
+    from pytest import MonkeyPatch
     from starlite.types.asgi_types import HTTPScope
 
 
@@ -21,3 +24,14 @@ def test_sentry_traces_sampler(http_scope: "HTTPScope", path: str, sample_rate:
         asgi_scope=http_scope, parent_sampled=None, transaction_context={}
     )
     assert sentry_traces_sampler(sentry_context) == sample_rate
+
+
+def test_configure_only_initializes_once(monkeypatch: "MonkeyPatch") -> None:
+    """Test that repeated calls to `configure()` don't initialize the SDK
+    again."""
+    sentry_init_mock = MagicMock()
+    monkeypatch.setattr(sentry_sdk, "init", sentry_init_mock)
+    monkeypatch.setattr(sentry, "_INITIALIZED", False)
+    sentry.configure()
+    sentry.configure()
+    sentry_init_mock.assert_called_once()
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 import pytest
-from asyncpg.pgproto import pgproto
 
 from starlite_saqlalchemy.constants import IS_SQLALCHEMY_INSTALLED
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
     from typing import Any
 
+    from asyncpg.pgproto import pgproto
     from pytest import MonkeyPatch
+    from sqlalchemy.orm import registry
 
+    from starlite_saqlalchemy.dto import FromMapped
     from starlite_saqlalchemy.testing.generic_mock_repository import (
         GenericMockRepository,
     )
@@ -22,8 +26,16 @@ if not IS_SQLALCHEMY_INSTALLED:
     collect_ignore_glob = ["*"]
 
 
+@pytest.fixture(name="_bases_registry", scope="session")
+def fx_bases_registry() -> registry:
+    """Registry shared by the declarative bases that `_patch_bases` creates."""
+    from sqlalchemy.orm import registry
+
+    return registry()
+
+
 @pytest.fixture(autouse=True)
-def _patch_bases(monkeypatch: MonkeyPatch) -> None:
+def _patch_bases(_bases_registry: registry, monkeypatch: MonkeyPatch) -> Iterator[None]:
     """Ensure new registry state for every test.
 
     This prevents errors such as "Table '...' is already defined for
@@ -34,36 +46,67 @@ def _patch_bases(monkeypatch: MonkeyPatch) -> None:
     from starlite_saqlalchemy.db import orm
 
     class NewBase(orm.CommonColumns, DeclarativeBase):
-        ...
+        registry = _bases_registry
 
     class NewAuditBase(orm.AuditColumns, orm.CommonColumns, DeclarativeBase):
-        ...
+        registry = _bases_registry
 
     monkeypatch.setattr(orm, "Base", NewBase)
     monkeypatch.setattr(orm, "AuditBase", NewAuditBase)
+    yield
+    # unmap whatever the test mapped, so the registry is empty for the next test
+    _bases_registry.dispose()
+    _bases_registry.metadata.clear()
 
 
-@pytest.fixture(name="authors")
-def fx_authors(raw_authors: list[dict[str, Any]]) -> list[Author]:
-    """Collection of parsed Author models."""
+@pytest.fixture(name="author_dtos", scope="session")
+def fx_author_dtos(raw_authors: tuple[Mapping[str, Any], ...]) -> tuple[FromMapped[Author], ...]:
+    """Author DTOs, validated once per session."""
     from tests.utils.domain import authors
 
-    mapped_authors = [authors.ReadDTO(**raw).to_mapped() for raw in raw_authors]
-    # convert these to pgproto UUIDs as that is what we get back from sqlalchemy
+    return tuple(authors.ReadDTO(**raw) for raw in raw_authors)
+
+
+@pytest.fixture(name="book_dtos", scope="session")
+def fx_book_dtos(raw_books: tuple[Mapping[str, Any], ...]) -> tuple[FromMapped[Book], ...]:
+    """Book DTOs, validated once per session."""
+    from tests.utils.domain import books
+
+    return tuple(books.ReadDTO(**raw) for raw in raw_books)
+
+
+@pytest.fixture(name="pgproto_ids", scope="session")
+def fx_pgproto_ids(
+    raw_authors: tuple[Mapping[str, Any], ...], raw_books: tuple[Mapping[str, Any], ...]
+) -> dict[UUID, pgproto.UUID]:
+    """The pgproto UUID for each author and book identifier.
+
+    These are what we get back from sqlalchemy.
+    """
+    from asyncpg.pgproto import pgproto
+
+    return {UUID(raw["id"]): pgproto.UUID(raw["id"]) for raw in (*raw_authors, *raw_books)}
+
+
+@pytest.fixture(name="authors")
+def fx_authors(
+    author_dtos: tuple[FromMapped[Author], ...], pgproto_ids: dict[UUID, pgproto.UUID]
+) -> list[Author]:
+    """Collection of parsed Author models."""
+    mapped_authors = [author_dto.to_mapped() for author_dto in author_dtos]
     for author in mapped_authors:
-        author.id = pgproto.UUID(str(author.id))
+        author.id = pgproto_ids[author.id]
     return mapped_authors
 
 
 @pytest.fixture(name="books")
-def fx_books(raw_books: list[dict[str, Any]]) -> list[Book]:
+def fx_books(
+    book_dtos: tuple[FromMapped[Book], ...], pgproto_ids: dict[UUID, pgproto.UUID]
+) -> list[Book]:
     """Collection of parsed Book models."""
-    from tests.utils.domain import books
-
-    mapped_books = [books.ReadDTO(**raw).to_mapped() for raw in raw_books]
-    # convert these to pgproto UUIDs as that is what we get back from sqlalchemy
+    mapped_books = [book_dto.to_mapped() for book_dto in book_dtos]
     for book in mapped_books:
-        book.id = pgproto.UUID(str(book.id))
+        book.id = pgproto_ids[book.id]
     return mapped_books
 
 
@@ -1,7 +1,11 @@
 # pylint: disable=wrong-import-position,wrong-import-order
 from __future__ import annotations
 
+from uuid import UUID
+
 import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from starlite_saqlalchemy.db import orm
 from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
@@ -19,6 +23,41 @@ async def test_repo_raises_conflict_if_add_with_id(
         await author_repository.add(authors[0])
 
 
+async def test_add_many(author_repository: GenericMockRepository[Author]) -> None:
+    """Test that mock repo adds each of many instances to the collection."""
+    instances = await author_repository.add_many([Author(name="a"), Author(name="b")])
+    assert len(instances) == 2
+    assert all(author_repository.collection[instance.id] is instance for instance in instances)
+
+
+async def test_list_cached_until_collection_changes(
+    author_repository: GenericMockRepository[Author],
+) -> None:
+    """Test that the listed instances are reused until the collection
+    members change."""
+    instances = await author_repository.list()
+    assert await author_repository.list() is instances
+    author = await author_repository.add(Author(name="someone"))
+    assert author in await author_repository.list()
+    await author_repository.delete(author.id)
+    assert author not in await author_repository.list()
+
+
+async def test_list_cache_shared_with_subclass() -> None:
+    """Test that a subclass sharing its parent's collection sees changes made
+    through the parent, or made directly to the collection."""
+    parent = GenericMockRepository[Author]
+
+    class Child(parent):
+        """Shares the parent's collection."""
+
+    assert await Child().list() == []
+    author = await parent().add(Author(name="someone"))
+    assert await Child().list() == [author]
+    del parent().collection[author.id]
+    assert await Child().list() == []
+
+
 def test_generic_mock_repository_parametrization() -> None:
     """Test that the mock repository handles multiple types."""
     author_repo = GenericMockRepository[Author]
@@ -27,6 +66,27 @@ def test_generic_mock_repository_parametrization() -> None:
     assert book_repo.model_type is Book  # type:ignore[misc]
 
 
+async def test_generic_mock_repository_parametrization_before_related_model_defined() -> None:
+    """Test that the mock repository can be parametrized with a model that
+    has a relationship to a model that isn't defined yet."""
+
+    class Parent(orm.Base):
+        """Related to a model defined after the repository type."""
+
+        children: Mapped[list[Child]] = relationship()
+
+    repository_type = GenericMockRepository[Parent]
+
+    class Child(orm.Base):
+        """Defined after the repository type."""
+
+        parent_id: Mapped[UUID] = mapped_column(ForeignKey("parent.id"))
+
+    repository = repository_type()
+    parent = await repository.add(Parent())
+    assert await repository.update(Parent(id=parent.id)) is parent
+
+
 def test_generic_mock_repository_seed_collection(
     author_repository_type: type[GenericMockRepository[Author]],
 ) -> None:
@@ -99,6 +159,21 @@ async def test_sets_updated_on_update(author_repository: GenericMockRepository[A
     assert instance.updated > original_updated
 
 
+async def test_update_sets_mapped_attributes(
+    author_repository: GenericMockRepository[Author],
+) -> None:
+    """Test that update copies the mapped attributes set on the data, and
+    nothing else."""
+    existing = list(author_repository.collection.values())[0]
+    data = Author(id=existing.id, name="Someone Else")
+    data.not_mapped = True  # type:ignore[attr-defined]
+    instance = await author_repository.update(data)
+    assert instance is existing
+    assert instance.name == "Someone Else"
+    assert instance.dob is not None
+    assert not hasattr(instance, "not_mapped")
+
+
 async def test_does_not_set_created_updated() -> None:
     """Test that the repository does not update the 'updated' timestamps when
     appropriate."""
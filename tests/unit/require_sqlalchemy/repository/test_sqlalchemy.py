@@ -2,15 +2,28 @@
 # pylint: disable=protected-access,redefined-outer-name
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, call
+from unittest.mock import AsyncMock, MagicMock, call, sentinel
+from uuid import UUID, uuid4
 
 import pytest
+from asyncpg.exceptions import PostgresError, UniqueViolationError
+from sqlalchemy import ForeignKey, select
 from sqlalchemy.exc import IntegrityError, InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from starlite_saqlalchemy.exceptions import ConflictError, StarliteSaqlalchemyError
+from sqlalchemy.orm import Mapped, make_transient_to_detached, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
+
+from starlite_saqlalchemy.db import orm
+from starlite_saqlalchemy.exceptions import (
+    ConflictError,
+    NotFoundError,
+    StarliteSaqlalchemyError,
+)
+from starlite_saqlalchemy.repository import sqlalchemy
 from starlite_saqlalchemy.repository.filters import (
     BeforeAfter,
     CollectionFilter,
@@ -20,6 +33,7 @@ from starlite_saqlalchemy.repository.sqlalchemy import (
     SQLAlchemyRepository,
     wrap_sqlalchemy_exception,
 )
+from tests.utils.domain import authors, books
 
 if TYPE_CHECKING:
     from pytest import MonkeyPatch
@@ -34,7 +48,66 @@ def mock_repo() -> SQLAlchemyRepository:
 
         model_type = MagicMock()  # pyright:ignore[reportGeneralTypeIssues]
 
-    return Repo(session=AsyncMock(spec=AsyncSession), select_=MagicMock())
+    select_ = MagicMock()
+    # statement building methods return the same select, so calls can be chained
+    select_.configure_mock(
+        **{f"{name}.return_value": select_ for name in ("where", "limit", "offset")}
+    )
+    return Repo(session=AsyncMock(spec=AsyncSession), select_=select_)
+
+
+def test_default_select_applies_default_options(monkeypatch: MonkeyPatch) -> None:
+    """Test that the default select statement is built with the class loader
+    options."""
+    select_mock = MagicMock()
+    monkeypatch.setattr(sqlalchemy, "select", select_mock)
+
+    class Repo(SQLAlchemyRepository[MagicMock]):
+        """Repo with mocked out stuff."""
+
+        model_type = MagicMock()  # pyright:ignore[reportGeneralTypeIssues]
+
+    repo = Repo(session=AsyncMock(spec=AsyncSession))
+    select_mock.assert_called_once_with(Repo.model_type)
+    select_mock().options.assert_called_once_with(*Repo.default_options)
+    assert repo._select is select_mock().options()
+
+
+def test_default_select_shared_between_instances() -> None:
+    """Test that the default select statement is built once per model
+    type."""
+    repo_1 = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    repo_2 = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    assert repo_1._select is repo_2._select
+
+
+def test_default_select_keeps_eager_relationship_loading() -> None:
+    """Test that eager loading configured on a relationship isn't overridden
+    by the default `raiseload("*")` option."""
+    repo = books.Repository(session=AsyncMock(spec=AsyncSession))
+    assert "JOIN author" in str(repo._select)
+
+
+def test_default_select_keeps_joined_loading_alias() -> None:
+    """Test that `lazy=False`, SQLAlchemy's alias for joined loading, isn't
+    overridden by the default `raiseload("*")` option."""
+
+    class Parent(orm.Base):
+        """Parent model."""
+
+    class Child(orm.Base):
+        """Joined loads its parent."""
+
+        parent_id: Mapped[UUID] = mapped_column(ForeignKey("parent.id"))
+        parent: Mapped[Parent] = relationship(lazy=False)
+
+    class Repo(SQLAlchemyRepository[Child]):
+        """Child repository."""
+
+        model_type = Child
+
+    repo = Repo(session=AsyncMock(spec=AsyncSession))
+    assert "JOIN parent" in str(repo._select)
 
 
 def test_wrap_sqlalchemy_integrity_error() -> None:
@@ -49,18 +122,115 @@ def test_wrap_sqlalchemy_generic_error() -> None:
         raise SQLAlchemyError
 
 
-async def test_sqlalchemy_repo_add(mock_repo: SQLAlchemyRepository) -> None:
+async def test_sqlalchemy_repo_add(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
     """Test expected method calls for add operation."""
     mock_instance = MagicMock()
+    refresh_unloaded_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "_refresh_unloaded", refresh_unloaded_mock)
     instance = await mock_repo.add(mock_instance)
     assert instance is mock_instance
     mock_repo.session.add.assert_called_once_with(mock_instance)
     mock_repo.session.flush.assert_called_once()
-    mock_repo.session.refresh.assert_called_once_with(mock_instance)
+    refresh_unloaded_mock.assert_called_once_with(mock_instance)
     mock_repo.session.expunge.assert_called_once_with(mock_instance)
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_add_many(mock_repo: SQLAlchemyRepository) -> None:
+    """Test expected method calls for add many operation on non-asyncpg
+    connections."""
+    mock_instances = [MagicMock(), MagicMock()]
+    mock_repo.session.connection.return_value.dialect.driver = "psycopg"
+    instances = await mock_repo.add_many(mock_instances)
+    assert instances is mock_instances
+    mock_repo.session.add_all.assert_called_once_with(mock_instances)
+    mock_repo.session.flush.assert_called_once()
+    assert [c.args for c in mock_repo.session.expunge.call_args_list] == [
+        (mock_instance,) for mock_instance in mock_instances
+    ]
+    mock_repo.session.expunge_all.assert_not_called()
+    mock_repo.session.commit.assert_not_called()
+
+
+def _patch_copy_records_to_table(repo: SQLAlchemyRepository) -> AsyncMock:
+    """Make the repository session connection look like asyncpg, and return
+    the mocked `copy_records_to_table()`."""
+    connection = repo.session.connection.return_value
+    connection.dialect.driver = "asyncpg"
+    raw_connection = MagicMock()
+    raw_connection.dbapi_connection.configure_mock(
+        _execute_mutex=asyncio.Lock(), _started=False, _start_transaction=AsyncMock()
+    )
+    raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    return raw_connection.driver_connection.copy_records_to_table  # type:ignore[no-any-return]
+
+
+async def test_sqlalchemy_repo_add_many_uses_copy_for_asyncpg() -> None:
+    """Test that add many writes large batches on asyncpg connections with
+    `COPY`."""
+    repo = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    copy_mock = _patch_copy_records_to_table(repo)
+    data = [authors.Author(name=str(i), dob=date.min) for i in range(repo.copy_threshold + 1)]
+    instances = await repo.add_many(data)
+    assert instances is data
+    assert all(isinstance(instance.id, UUID) for instance in instances)
+    copy_mock.assert_called_once()
+    assert copy_mock.call_args.args == ("author",)
+    assert copy_mock.call_args.kwargs["columns"] == ["name", "dob", "created", "updated", "id"]
+    assert len(copy_mock.call_args.kwargs["records"]) == repo.copy_threshold + 1
+    repo.session.add_all.assert_not_called()
+    repo.session.flush.assert_not_called()
+
+
+async def test_sqlalchemy_repo_add_many_copy_begins_driver_transaction() -> None:
+    """Test that `COPY` runs inside the adapter's transaction, rather than in
+    autocommit, when it is the first statement on the connection."""
+    repo = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    copy_mock = _patch_copy_records_to_table(repo)
+    raw_connection = await repo.session.connection.return_value.get_raw_connection()
+    start_transaction_mock = raw_connection.dbapi_connection._start_transaction
+    start_transaction_mock.side_effect = copy_mock.assert_not_called
+    data = [authors.Author(name=str(i), dob=date.min) for i in range(repo.copy_threshold + 1)]
+    await repo.add_many(data)
+    start_transaction_mock.assert_awaited_once()
+    copy_mock.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("driver_error", "expected"),
+    [
+        (UniqueViolationError("duplicate key"), ConflictError),
+        (PostgresError("other"), StarliteSaqlalchemyError),
+    ],
+)
+async def test_sqlalchemy_repo_add_many_copy_wraps_driver_errors(
+    driver_error: PostgresError, expected: type[Exception]
+) -> None:
+    """Test that driver errors raised by `COPY` are mapped like those raised
+    by a flush."""
+    repo = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    _patch_copy_records_to_table(repo).side_effect = driver_error
+    data = [authors.Author(name=str(i), dob=date.min) for i in range(repo.copy_threshold + 1)]
+    with pytest.raises(expected):
+        await repo.add_many(data)
+
+
+async def test_sqlalchemy_repo_add_many_flushes_instances_with_related_objects() -> None:
+    """Test that add many doesn't use `COPY` for instances that need
+    relationship cascades."""
+    repo = books.Repository(session=AsyncMock(spec=AsyncSession))
+    copy_mock = _patch_copy_records_to_table(repo)
+    author = authors.Author(name="Agatha Christie", dob=date(1890, 9, 15))
+    data = [books.Book(title=str(i), author=author) for i in range(repo.copy_threshold + 1)]
+    assert await repo.add_many(data) is data
+    copy_mock.assert_not_called()
+    repo.session.add_all.assert_called_once_with(data)
+    repo.session.flush.assert_called_once()
+
+
 async def test_sqlalchemy_repo_delete(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
@@ -84,24 +254,82 @@ async def test_sqlalchemy_repo_get_member(
     result_mock.scalar_one_or_none = MagicMock(return_value=mock_instance)
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
+    select_mock = mock_repo._select
+    id_column_mock = mock_repo._id_column
+    id_column_mock.__eq__.return_value = sentinel.id_clause
     instance = await mock_repo.get("instance-id")
     assert instance is mock_instance
+    id_column_mock.__eq__.assert_called_once_with("instance-id")
+    select_mock.where.assert_called_once_with(sentinel.id_clause)
     mock_repo.session.expunge.assert_called_once_with(mock_instance)
     mock_repo.session.commit.assert_not_called()
 
 
+async def test_sqlalchemy_repo_get_member_by_primary_key() -> None:
+    """Test that member get operation uses `Session.get()` for primary key
+    lookups with the default select."""
+    repo = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    mock_instance = MagicMock()
+    repo.session.get.return_value = mock_instance
+    instance = await repo.get("instance-id")
+    assert instance is mock_instance
+    repo.session.get.assert_called_once_with(
+        authors.Author, "instance-id", options=repo.default_options
+    )
+    repo.session.execute.assert_not_called()
+    repo.session.expunge.assert_called_once_with(mock_instance)
+
+
+async def test_sqlalchemy_repo_get_member_by_primary_key_keeps_eager_loading() -> None:
+    """Test that primary key lookups load relationships configured with an
+    eager strategy, ahead of the default `raiseload("*")` option."""
+    repo = books.Repository(session=AsyncMock(spec=AsyncSession))
+    await repo.get("instance-id")
+    options = repo.session.get.call_args.kwargs["options"]
+    assert options[-1] is repo.default_options[0]
+    assert "JOIN author" in str(select(books.Book).options(*options))
+
+
+async def test_sqlalchemy_repo_get_member_cached() -> None:
+    """Test that repeated gets for the same identifier are served without
+    another query, until the instance is updated."""
+    repo = authors.Repository(session=AsyncMock(spec=AsyncSession))
+    mock_instance = MagicMock()
+    repo.session.get.return_value = mock_instance
+    assert await repo.get("instance-id") is mock_instance
+    assert await repo.get("instance-id") is mock_instance
+    repo.session.get.assert_called_once()
+    repo._get_cache.pop("instance-id")
+    assert await repo.get("instance-id") is mock_instance
+    assert repo.session.get.call_count == 2
+
+
+async def test_sqlalchemy_repo_update_invalidates_get_cache(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that update discards the cached instance for the identifier."""
+    mock_instance = MagicMock(id="instance-id")
+    monkeypatch.setattr(sqlalchemy, "inspect", MagicMock(return_value=MagicMock(pending=False)))
+    monkeypatch.setattr(mock_repo, "_refresh_unloaded", AsyncMock())
+    mock_repo._get_cache["instance-id"] = MagicMock()
+    mock_repo.session.merge.return_value = mock_instance
+    await mock_repo.update(mock_instance)
+    assert "instance-id" not in mock_repo._get_cache
+
+
 async def test_sqlalchemy_repo_list(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
     """Test expected method calls for list operation."""
     mock_instances = [MagicMock(), MagicMock()]
     result_mock = MagicMock()
-    result_mock.scalars = MagicMock(return_value=mock_instances)
+    result_mock.scalars().all.return_value = mock_instances
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
     instances = await mock_repo.list()
     assert instances == mock_instances
-    mock_repo.session.expunge.assert_has_calls(*mock_instances)
+    mock_repo.session.expunge_all.assert_called_once()
+    mock_repo.session.expunge.assert_not_called()
     mock_repo.session.commit.assert_not_called()
 
 
@@ -112,8 +340,6 @@ async def test_sqlalchemy_repo_list_with_pagination(
     result_mock = MagicMock()
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
-    mock_repo._select.limit.return_value = mock_repo._select
-    mock_repo._select.offset.return_value = mock_repo._select
     await mock_repo.list(LimitOffset(2, 3))
     mock_repo._select.limit.assert_called_once_with(2)
     mock_repo._select.limit().offset.assert_called_once_with(3)  # type:ignore[call-arg]
@@ -125,30 +351,44 @@ async def test_sqlalchemy_repo_list_with_before_after_filter(
     """Test list operation with BeforeAfter filter."""
     field_name = "updated"
     # model has to support comparison with the datetimes
-    getattr(mock_repo.model_type, field_name).__lt__ = lambda self, compare: "lt"
-    getattr(mock_repo.model_type, field_name).__gt__ = lambda self, compare: "gt"
+    field = getattr(mock_repo.model_type, field_name)
+    field.__lt__ = lambda self, compare: "lt"
+    field.__gt__ = lambda self, compare: "gt"
     result_mock = MagicMock()
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
-    mock_repo._select.where.return_value = mock_repo._select
     await mock_repo.list(BeforeAfter(field_name, datetime.max, datetime.min))
-    assert mock_repo._select.where.call_count == 2
-    assert mock_repo._select.where.has_calls([call("gt"), call("lt")])
+    mock_repo._select.where.assert_called_once_with("lt", "gt")
 
 
 async def test_sqlalchemy_repo_list_with_collection_filter(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
     """Test behavior of list operation given CollectionFilter."""
-    field_name = "id"
+    field = mock_repo.model_type.id
     result_mock = MagicMock()
     execute_mock = AsyncMock(return_value=result_mock)
     monkeypatch.setattr(mock_repo, "_execute", execute_mock)
-    mock_repo._select.where.return_value = mock_repo._select
     values = [1, 2, 3]
-    await mock_repo.list(CollectionFilter(field_name, values))
+    await mock_repo.list(CollectionFilter("id", values))
     mock_repo._select.where.assert_called_once()
-    getattr(mock_repo.model_type, field_name).in_.assert_called_once_with(values)
+    field.in_.assert_called_once_with(values)
+
+
+async def test_sqlalchemy_repo_list_with_filter_subclass(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that list operation handles subclasses of the supported filter
+    types."""
+
+    @dataclass
+    class MyLimitOffset(LimitOffset):
+        """Subclassed pagination filter."""
+
+    monkeypatch.setattr(mock_repo, "_execute", AsyncMock(return_value=MagicMock()))
+    await mock_repo.list(MyLimitOffset(2, 3))
+    mock_repo._select.limit.assert_called_once_with(2)
+    mock_repo._select.limit().offset.assert_called_once_with(3)  # type:ignore[call-arg]
 
 
 async def test_sqlalchemy_repo_unknown_filter_type_raises(mock_repo: SQLAlchemyRepository) -> None:
@@ -161,31 +401,70 @@ async def test_sqlalchemy_repo_update(
     mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
 ) -> None:
     """Test the sequence of repo calls for update operation."""
-    id_ = 3
     mock_instance = MagicMock()
-    get_id_value_mock = MagicMock(return_value=id_)
-    monkeypatch.setattr(mock_repo, "get_id_attribute_value", get_id_value_mock)
-    get_mock = AsyncMock()
-    monkeypatch.setattr(mock_repo, "get", get_mock)
+    monkeypatch.setattr(sqlalchemy, "inspect", MagicMock(return_value=MagicMock(pending=False)))
+    refresh_unloaded_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "_refresh_unloaded", refresh_unloaded_mock)
     mock_repo.session.merge.return_value = mock_instance
     instance = await mock_repo.update(mock_instance)
     assert instance is mock_instance
     mock_repo.session.merge.assert_called_once_with(mock_instance)
     mock_repo.session.flush.assert_called_once()
-    mock_repo.session.refresh.assert_called_once_with(mock_instance)
+    refresh_unloaded_mock.assert_called_once_with(mock_instance)
     mock_repo.session.expunge.assert_called_once_with(mock_instance)
     mock_repo.session.commit.assert_not_called()
 
 
-async def test_sqlalchemy_repo_upsert(mock_repo: SQLAlchemyRepository) -> None:
+def test_sqlalchemy_repo_expires_relationship_of_changed_foreign_key() -> None:
+    """Test that a loaded relationship is expired when its foreign key is
+    changed, so that it is reloaded after the flush."""
+    repo = books.Repository(session=AsyncMock(spec=AsyncSession))
+    author = authors.Author(id=uuid4(), name="Agatha Christie")
+    book = books.Book(id=uuid4(), title="Murder on the Orient Express", author_id=author.id)
+    make_transient_to_detached(book)
+    set_committed_value(book, "author", author)  # type:ignore[no-untyped-call]
+    repo._expire_stale_relationships(book)
+    repo.session.expire.assert_not_called()
+    book.author_id = uuid4()
+    repo._expire_stale_relationships(book)
+    repo.session.expire.assert_called_once_with(book, ["author"])
+
+
+async def test_sqlalchemy_repo_update_raises_not_found(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that update raises if there is no existing instance to merge
+    into, and discards what the merge cascaded into the session."""
+    mock_instance, related_instance, pending_instance = MagicMock(), MagicMock(), MagicMock()
+    monkeypatch.setattr(sqlalchemy, "inspect", MagicMock(return_value=MagicMock(pending=True)))
+    # pending instances before, and after the merge
+    mock_repo.session.new.__iter__.side_effect = [
+        iter([pending_instance]),
+        iter([pending_instance, mock_instance, related_instance]),
+    ]
+    mock_repo.session.merge.return_value = mock_instance
+    with pytest.raises(NotFoundError):
+        await mock_repo.update(mock_instance)
+    assert mock_repo.session.expunge.call_args_list == [
+        call(mock_instance),
+        call(related_instance),
+    ]
+    mock_repo.session.flush.assert_not_called()
+
+
+async def test_sqlalchemy_repo_upsert(
+    mock_repo: SQLAlchemyRepository, monkeypatch: MonkeyPatch
+) -> None:
     """Test the sequence of repo calls for upsert operation."""
     mock_instance = MagicMock()
+    refresh_unloaded_mock = AsyncMock()
+    monkeypatch.setattr(mock_repo, "_refresh_unloaded", refresh_unloaded_mock)
     mock_repo.session.merge.return_value = mock_instance
     instance = await mock_repo.upsert(mock_instance)
     assert instance is mock_instance
     mock_repo.session.merge.assert_called_once_with(mock_instance)
     mock_repo.session.flush.assert_called_once()
-    mock_repo.session.refresh.assert_called_once_with(mock_instance)
+    refresh_unloaded_mock.assert_called_once_with(mock_instance)
     mock_repo.session.expunge.assert_called_once_with(mock_instance)
     mock_repo.session.commit.assert_not_called()
 
@@ -204,6 +483,25 @@ async def test_execute(mock_repo: SQLAlchemyRepository) -> None:
     mock_repo.session.execute.assert_called_once_with(mock_repo._select)
 
 
+async def test_refresh_unloaded(mock_repo: SQLAlchemyRepository) -> None:
+    """Test that only attributes not populated on the instance are
+    refreshed."""
+    instance = authors.Author(name="someone", dob=date.min)
+    await mock_repo._refresh_unloaded(instance)
+    mock_repo.session.refresh.assert_called_once_with(
+        instance, attribute_names={"id", "created", "updated"}
+    )
+
+
+async def test_refresh_unloaded_noop_if_all_loaded(mock_repo: SQLAlchemyRepository) -> None:
+    """Test that we don't refresh an instance that is already populated."""
+    instance = authors.Author(
+        id=uuid4(), name="someone", dob=date.min, created=datetime.min, updated=datetime.min
+    )
+    await mock_repo._refresh_unloaded(instance)
+    mock_repo.session.refresh.assert_not_called()
+
+
 def test_filter_in_collection_noop_if_collection_empty(mock_repo: SQLAlchemyRepository) -> None:
     """Ensures we don't filter on an empty collection."""
     mock_repo._filter_in_collection("id", [])
@@ -223,9 +521,14 @@ def test__filter_on_datetime_field(
 ) -> None:
     """Test through branches of _filter_on_datetime_field()"""
     field_mock = MagicMock()
-    field_mock.__gt__ = field_mock.__lt__ = lambda self, other: True
+    field_mock.__gt__ = lambda self, other: ("gt", other)
+    field_mock.__lt__ = lambda self, other: ("lt", other)
     mock_repo.model_type.updated = field_mock
+    select_mock = mock_repo._select
     mock_repo._filter_on_datetime_field("updated", before, after)
+    expected = [("lt", before)] if before is not None else []
+    expected += [("gt", after)] if after is not None else []
+    select_mock.where.assert_called_once_with(*expected)
 
 
 def test_filter_collection_by_kwargs(mock_repo: SQLAlchemyRepository) -> None:
@@ -244,3 +547,9 @@ def test_filter_collection_by_kwargs_raises_repository_exception_for_attribute_e
     )
     with pytest.raises(StarliteSaqlalchemyError):
         mock_repo.filter_collection_by_kwargs(a=1)
+
+
+def test_id_column_resolved_per_repository_type() -> None:
+    """Test the identifier attribute is resolved when the repository type is
+    created."""
+    assert authors.Repository._id_column is authors.Author.id
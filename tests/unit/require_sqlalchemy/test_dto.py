@@ -12,32 +12,33 @@ from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column, relationshi
 
 from starlite_saqlalchemy import dto, settings
 from starlite_saqlalchemy.db import orm
+from starlite_saqlalchemy.dto import from_mapped
 from tests.utils.domain.authors import Author, WriteDTO
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
     from types import ModuleType
 
 
-def test_model_write_dto(raw_authors: list[dict[str, Any]]) -> None:
+def test_model_write_dto(raw_authors: "tuple[Mapping[str, Any], ...]") -> None:
     """Create a model from DTO instance and check the values on the model."""
     dto_type = dto.FromMapped[Annotated[Author, dto.config("write")]]
     assert dto_type.__fields__.keys() == {"name", "dob"}
     inst = dto_type(**raw_authors[0])
     model = Author(**inst.dict(exclude_unset=True))
-    assert {k: v for k, v in model.__dict__.items() if not k.startswith("_")} == {
+    assert {k: getattr(model, k) for k in ("name", "dob")} == {
         "name": "Agatha Christie",
         "dob": date(1890, 9, 15),
     }
 
 
-def test_model_read_dto(raw_authors: list[dict[str, Any]]) -> None:
+def test_model_read_dto(raw_authors: "tuple[Mapping[str, Any], ...]") -> None:
     """Create a model from DTO instance and check the values on the model."""
     dto_type = dto.FromMapped[Annotated[Author, dto.config("read")]]
     assert dto_type.__fields__.keys() == {"name", "dob", "id", "created", "updated"}
     inst = dto_type(**raw_authors[1])
     model = Author(**inst.dict(exclude_unset=True))
-    assert {k: v for k, v in model.__dict__.items() if not k.startswith("_")} == {
+    assert {k: getattr(model, k) for k in ("name", "dob", "id", "created", "updated")} == {
         "name": "Leo Tolstoy",
         "dob": date(1828, 9, 9),
         "id": UUID("5ef29f3c-3560-4d15-ba6b-a2e5c721e4d2"),
@@ -52,19 +53,45 @@ def test_dto_exclude() -> None:
     assert dto_type.__fields__.keys() == {"name", "dob", "created", "updated"}
 
 
-@pytest.mark.parametrize(
-    ("purpose", "default", "exp"), [(dto.Purpose.WRITE, 3, 3), (dto.Purpose.READ, 3, None)]
-)
-def test_write_dto_for_model_field_scalar_default(
-    purpose: dto.Purpose, default: Any, exp: Any
-) -> None:
+def test_config_returns_same_instance_for_equal_arguments() -> None:
+    """Test that `dto.config()` interns configs with equal purpose and exclusions."""
+    assert dto.config("read", {"id"}) is dto.config(dto.Purpose.READ, frozenset({"id"}))
+    assert dto.config("read") is not dto.config("read", {"id"})
+
+
+def test_dto_config_coerces_exclude_to_frozenset() -> None:
+    """Test that a `DTOConfig` built with a `set` of exclusions is hashable."""
+    dto_config = dto.DTOConfig(purpose=dto.Purpose.READ, exclude={"id"})  # type:ignore[arg-type]
+    assert dto_config.exclude == frozenset({"id"})
+    assert hash(dto_config) == hash(dto.config("read", {"id"}))
+
+
+def test_dto_cached_per_model_and_config() -> None:
+    """Test that a DTO type is built once for the same model and config."""
+    dto_type = dto.FromMapped[Annotated[Author, dto.config("read", {"id"})]]
+    assert dto.FromMapped[Annotated[Author, dto.config("read", {"id"})]] is dto_type
+    assert dto.FromMapped[Annotated[Author, dto.config("read")]] is not dto_type
+    assert dto.FromMapped[Annotated[Author, dto.config("write", {"id"})]] is not dto_type
+
+
+def test_type_hints_resolved_once_per_model() -> None:
+    """Test that model type hints are resolved once, and reused for each DTO
+    built for the model."""
+    hints = from_mapped._get_type_hints(Author)
+    assert hints["name"] == Mapped[str]
+    assert from_mapped._get_type_hints(Author) is hints
+
+
+def test_write_dto_for_model_field_scalar_default() -> None:
     """Test DTO scalar defaults for write and read purposes."""
 
     class Model(orm.Base):
-        field: Mapped[int] = mapped_column(default=default)
+        field: Mapped[int] = mapped_column(default=3)
 
-    dto_model = dto.FromMapped[Annotated[Model, dto.config(purpose)]]
-    assert dto_model.__fields__["field"].default == exp
+    write_dto = dto.FromMapped[Annotated[Model, dto.config(dto.Purpose.WRITE)]]
+    assert write_dto.__fields__["field"].default == 3
+    read_dto = dto.FromMapped[Annotated[Model, dto.config(dto.Purpose.READ)]]
+    assert read_dto.__fields__["field"].default is None
 
 
 def test_write_dto_for_model_field_factory_default() -> None:
@@ -102,8 +129,7 @@ def test_read_dto_for_model_field_unsupported_default() -> None:
         ]
 
 
-@pytest.mark.parametrize("purpose", [dto.Purpose.WRITE, dto.Purpose.READ])
-def test_dto_for_private_model_field(purpose: dto.Purpose) -> None:
+def test_dto_for_private_model_field() -> None:
     """Ensure that fields markets as PRIVATE are excluded from DTO."""
 
     class Model(orm.Base):
@@ -112,19 +138,20 @@ def test_dto_for_private_model_field(purpose: dto.Purpose) -> None:
             info={settings.api.DTO_INFO_KEY: dto.DTOField(mark=dto.Mark.PRIVATE)},
         )
 
-    dto_model = dto.FromMapped[Annotated[Model, dto.config(purpose)]]
-    assert "field" not in dto_model.__fields__
+    for purpose in (dto.Purpose.WRITE, dto.Purpose.READ):
+        dto_model = dto.FromMapped[Annotated[Model, dto.config(purpose)]]
+        assert "field" not in dto_model.__fields__
 
 
-@pytest.mark.parametrize("purpose", [dto.Purpose.WRITE, dto.Purpose.READ])
-def test_dto_for_non_mapped_model_field(purpose: dto.Purpose) -> None:
+def test_dto_for_non_mapped_model_field() -> None:
     """Ensure that we exclude unmapped fields from DTOs."""
 
     class Model(orm.Base):
         field: ClassVar[datetime]
 
-    dto_model = dto.FromMapped[Annotated[Model, dto.config(purpose)]]
-    assert "field" not in dto_model.__fields__
+    for purpose in (dto.Purpose.WRITE, dto.Purpose.READ):
+        dto_model = dto.FromMapped[Annotated[Model, dto.config(purpose)]]
+        assert "field" not in dto_model.__fields__
 
 
 def test_dto_factory_forward_ref_annotations(create_module: "Callable[[str], ModuleType]") -> None:
@@ -185,11 +212,10 @@ def test_subclassed_dto() -> None:
 def test_dto_attrib_validator() -> None:
     """Test arbitrary single arg callables as validators."""
 
-    validator_called = False
+    validator_calls: list[datetime] = []
 
     def validate_datetime(val: datetime) -> datetime:
-        nonlocal validator_called
-        validator_called = True
+        validator_calls.append(val)
         return val
 
     class Model(orm.Base):
@@ -199,7 +225,7 @@ def test_dto_attrib_validator() -> None:
 
     dto_model = dto.FromMapped[Annotated[Model, dto.config("write")]]
     dto_model.parse_obj({"id": 1, "field": datetime.min})
-    assert validator_called
+    assert validator_calls == [datetime.min]
 
 
 def test_dto_attrib_pydantic_type() -> None:
@@ -271,6 +297,23 @@ def test_to_mapped_model_with_scalar_relationship() -> None:
     assert isinstance(mapped_instance.a, A)
 
 
+def test_relationship_dto_built_once() -> None:
+    """Test that the DTO for a related model is built once, and shared by the
+    DTOs that include it."""
+
+    class A(orm.Base):
+        ...
+
+    class B(orm.Base):
+        a_id: Mapped[int] = mapped_column(ForeignKey("a.id"))
+        a: Mapped[A] = relationship("A")
+
+    dto_1 = dto.FromMapped[Annotated[B, "write"]]
+    dto_2 = dto.FromMapped[Annotated[B, dto.config("write", {"a_id"})]]
+    assert dto_1 is not dto_2
+    assert dto_1.__fields__["a"].type_ is dto_2.__fields__["a"].type_
+
+
 def test_dto_field_pydantic_field() -> None:
     """Test specifying DTOField.pydantic_field."""
 
@@ -13,6 +13,8 @@ def test_sqla_touch_updated_timestamp() -> None:
     orm.touch_updated_timestamp(mock_session)
     for mock_instance in mock_session.dirty:
         assert isinstance(mock_instance.updated, datetime.datetime)
+    first, second = mock_session.dirty
+    assert first.updated is second.updated
 
 
 def test_sqla_touch_updated_no_updated() -> None:
@@ -27,3 +29,9 @@ def test_sqla_touch_updated_no_updated() -> None:
     mock_session = MagicMock(dirty=[instance])
     orm.touch_updated_timestamp(mock_session)
     assert "updated" not in vars(instance)
+
+
+def test_relationship_selectin() -> None:
+    """Test that the relationship helper configures the selectin loading
+    strategy."""
+    assert orm.relationship_selectin("Model").lazy == "selectin"
@@ -1,6 +1,7 @@
 """Tests for Service object patterns."""
 from __future__ import annotations
 
+import sys
 from datetime import date
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -102,3 +103,10 @@ async def test_service_method_default_behavior() -> None:
         await service_obj.get("abc")
     with pytest.raises(NotFoundError):
         await service_obj.delete("abc")
+
+
+def test_service_id_interned() -> None:
+    """Test the service type identifier is interned."""
+    service_id = domain.authors.Service.__id__
+    assert service_id == "tests.utils.domain.authors.Service"
+    assert sys.intern("tests.utils.domain.authors.Service") is service_id
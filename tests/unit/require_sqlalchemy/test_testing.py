@@ -17,6 +17,7 @@ from starlite_saqlalchemy import testing
 from tests.utils.domain.authors import Service as AuthorService
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from typing import Any
 
     from pytest import MonkeyPatch
@@ -49,7 +50,7 @@ def fx_mock_client(
 @pytest.fixture(name="tester")
 def fx_tester(
     authors: list[Author],
-    raw_authors: list[dict[str, Any]],
+    raw_authors: tuple[Mapping[str, Any], ...],
     mock_client: TestClient,
     monkeypatch: MonkeyPatch,
     mock_response: MagicMock,
@@ -60,7 +61,7 @@ def fx_tester(
         client=mock_client,
         base_path="/authors",
         collection=authors[:1],
-        raw_collection=raw_authors[:1],
+        raw_collection=[dict(raw) for raw in raw_authors[:1]],
         service_type=AuthorService,
         monkeypatch=monkeypatch,
     )
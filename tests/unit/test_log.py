@@ -135,7 +135,7 @@ async def test_before_send_handler_exclude_paths(
 async def test_before_send_handler_http_response_start(
     status: int,
     level: int,
-    http_response_start: HTTPResponseStartEvent,
+    mutable_http_response_start: HTTPResponseStartEvent,
     before_send_handler: log.controller.BeforeSendHandler,
     http_scope: HTTPScope,
     state: State,
@@ -143,23 +143,23 @@ async def test_before_send_handler_http_response_start(
     """When handler receives a response start event, it should store the
     message in the connection state for later logging, and also use the status
     code to determine the severity of the eventual log."""
-    http_response_start["status"] = status
+    mutable_http_response_start["status"] = status
     assert http_scope["state"] == {}
-    await before_send_handler(http_response_start, state, http_scope)
+    await before_send_handler(mutable_http_response_start, state, http_scope)
     assert http_scope["state"]["log_level"] == level
-    assert http_scope["state"]["http.response.start"] == http_response_start
+    assert http_scope["state"]["http.response.start"] == mutable_http_response_start
 
 
 async def test_before_send_handler_http_response_body_with_more_body(
     before_send_handler: log.controller.BeforeSendHandler,
     cap_logger: CapturingLogger,
-    http_response_body: HTTPResponseBodyEvent,
+    mutable_http_response_body: HTTPResponseBodyEvent,
     http_scope: HTTPScope,
     state: State,
 ) -> None:
     """We ignore intermediate response body messages, so should be a noop."""
-    http_response_body["more_body"] = True
-    await before_send_handler(http_response_body, state, http_scope)
+    mutable_http_response_body["more_body"] = True
+    await before_send_handler(mutable_http_response_body, state, http_scope)
     assert [] == cap_logger.calls
 
 
@@ -0,0 +1,19 @@
+"""Shared test utilities."""
+from __future__ import annotations
+
+from typing import Any
+
+
+class AsyncRecorder:
+    """Async callable that records the arguments of each call.
+
+    A lightweight stand-in for `AsyncMock` where a test only needs to
+    inspect how a coroutine function was called.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        """`(args, kwargs)` of each call, in call order."""
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append((args, kwargs))